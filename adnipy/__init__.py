@@ -2,18 +2,111 @@
 
 """Top-level package for adnipy."""
 
+# Standard library imports
+import importlib
+import importlib.util
+import sys
+
 __author__ = """Maximilian Cosmo Sitter"""
 __email__ = "msitter@smail.uni-koeln.de"
 __version__ = "1.0.0"
 
 # Let users know if they're missing any of our hard dependencies
-import matplotlib
-import pandas as pd
+_hard_dependencies = ("pandas", "matplotlib")
+_missing_dependencies = [
+    dependency
+    for dependency in _hard_dependencies
+    if importlib.util.find_spec(dependency) is None
+]
+if _missing_dependencies:
+    raise ImportError(
+        "Unable to import required dependencies: " + ", ".join(_missing_dependencies)
+    )
+
+# Submodules and their public names are imported on first access,
+# so that importing adnipy does not import pandas.
+_submodules = (
+    "adni",
+    "adni_dask",
+    "adnipy",
+    "cache",
+    "cli",
+    "data",
+    "files",
+    "instrumentation",
+    "parallel",
+    "subjects",
+    "synthetic",
+)
+_attributes = {
+    "ADNI": "adni",
+    "get_matching_images": "adnipy",
+    "match_visits": "adnipy",
+    "read_csv": "adnipy",
+    "read_ipc": "adnipy",
+    "summarize": "adnipy",
+    "timedelta": "adnipy",
+    "timedelta_matrix": "adnipy",
+    "verify_images": "files",
+    "instrument": "instrumentation",
+    "SubjectIndex": "subjects",
+}
+
+__all__ = list(_attributes)
+
+
+def __getattr__(name):
+    """Import submodules and their attributes when they are first used."""
+    if name in _submodules:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _attributes:
+        module = importlib.import_module(f".{_attributes[name]}", __name__)
+        attribute = getattr(module, name)
+        globals()[name] = attribute
+        return attribute
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List attributes including the ones, which are not imported yet."""
+    return sorted(set(globals()) | set(_submodules) | set(_attributes))
+
+
+class _RegisterAccessor:
+    """Import adnipy.adni, which registers the accessor, after pandas.
+
+    The finder is removed from sys.meta_path after pandas is found, so it
+    only runs once.
+    """
+
+    def find_spec(self, fullname, path=None, target=None):
+        """Find pandas with the other finders and wrap its loader."""
+        if fullname != "pandas":
+            return None
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+        spec = importlib.util.find_spec(fullname)
+        if spec is None or spec.loader is None:
+            return spec
+
+        exec_module = spec.loader.exec_module
+
+        def exec_and_register(module):
+            exec_module(module)
+            importlib.import_module(".adni", __name__)
+
+        spec.loader.exec_module = exec_and_register
+        return spec
 
-from .adni import ADNI
-from .adnipy import get_matching_images, read_csv, timedelta
 
-del matplotlib, pd
+# The 'adni' dataframe accessor is registered once adnipy.adni is imported.
+# This is cheap if pandas is already in use, otherwise it is imported right
+# after pandas, so that the order of the imports does not matter.
+if "pandas" in sys.modules:
+    from . import adni
+else:
+    sys.meta_path.insert(0, _RegisterAccessor())
 
 
 # module level doc-string
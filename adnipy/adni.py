@@ -5,8 +5,95 @@
 # pylint: disable=R0914
 
 # Third party imports
+import numpy as np
 import pandas as pd
 
+from . import parallel
+from .cache import memoized
+from .instrumentation import instrumented
+
+
+def _slopes(dataframe, *args):
+    """Fit slopes of a shard."""
+    return dataframe.adni.slopes(*args)
+
+
+def _timepoints(dataframe, *args):
+    """Extract timepoints of a shard."""
+    return dataframe.adni.timepoints(*args)
+
+
+VISCODE_PATTERN = (
+    r"^(?:(?P<screening>sc|scmri)|(?P<baseline>bl|init)"
+    r"|m(?P<months>\d+)|y(?P<years>\d+))$"
+)
+
+
+def parse_viscodes(viscodes):
+    """Parse ADNI visit codes into ordered visits and months.
+
+    Each distinct code is parsed once, so long columns with few codes are
+    fast. 'sc' and 'scmri' are month 0 before 'bl', 'mNN' is month NN and
+    'yN' is month 12 * N. Other codes have no month and come last.
+
+    Parameters
+    ----------
+    viscodes : pd.Series
+        Visit codes like 'VISCODE' or 'VISCODE2'.
+
+    Returns
+    -------
+    pd.DataFrame
+        'VISCODE' as an ordered categorical and 'VISMONTH' as months since
+        baseline with the index of viscodes.
+
+    Examples
+    --------
+    >>> viscodes = pd.Series(["m102", "bl", "m12", "y1", "sc", "uns1"])
+    >>> visits = parse_viscodes(viscodes)
+    >>> visits
+      VISCODE  VISMONTH
+    0    m102       102
+    1      bl         0
+    2     m12        12
+    3      y1        12
+    4      sc         0
+    5    uns1      <NA>
+    >>> visits["VISCODE"].cat.categories.tolist()
+    ['sc', 'bl', 'm12', 'y1', 'm102', 'uns1']
+
+    """
+    codes, uniques = pd.factorize(viscodes)
+    uniques = pd.Series(uniques, dtype=object)
+    parts = uniques.astype(str).str.strip().str.lower().str.extract(VISCODE_PATTERN)
+    months = pd.to_numeric(parts["months"]).fillna(pd.to_numeric(parts["years"]) * 12)
+    months[parts["screening"].notna() | parts["baseline"].notna()] = 0
+
+    order = pd.DataFrame(
+        {
+            "unparsed": months.isna(),
+            "month": months,
+            "baseline": parts["baseline"].notna(),
+            "code": uniques.astype(str),
+        }
+    ).sort_values(["unparsed", "month", "baseline", "code"], kind="stable")
+    positions = np.empty(len(uniques), dtype=np.int64)
+    positions[order.index.to_numpy()] = np.arange(len(uniques))
+    new_codes = np.where(codes < 0, -1, positions[codes])
+
+    return pd.DataFrame(
+        {
+            "VISCODE": pd.Categorical.from_codes(
+                new_codes, categories=uniques[order.index].to_numpy(), ordered=True
+            ),
+            # missing codes are -1 and take the appended NaN
+            "VISMONTH": pd.array(
+                np.append(months.to_numpy(dtype=float), np.nan)[codes], dtype="Int16"
+            ),
+        },
+        index=viscodes.index,
+    )
+
 
 @pd.api.extensions.register_dataframe_accessor("adni")
 class ADNI:
@@ -41,6 +128,8 @@ class ADNI:
         "update_stamp",
     ]
     INDEX = ["Subject ID", "Image ID"]
+    PROCESSING_STEPS = ["Original", "Pre-processed", "Processed"]
+    PRIORITY_RULES = [("Type", PROCESSING_STEPS[::-1]), ("Image ID", False)]
     MAPPER = {
         # Collections
         "Image": "Image ID",
@@ -65,10 +154,51 @@ class ADNI:
         ----------
         _df : pd.DataFrame
             This represents the dataframe object, which calls the method.
+        _pure : bool
+            If true, methods do not change _df. See `pure`.
 
         """
         self._df = pandas_dataframe
+        self._pure = False
+
+    @property
+    def pure(self):
+        """Accessor, whose methods do not change the dataframe.
+
+        The methods work on a shallow copy, so the results share the data of
+        unchanged columns with the dataframe instead of copying them.
+        This is safe with pandas Copy-on-Write and allows processing shared
+        dataframes concurrently.
+
+        Returns
+        -------
+        ADNI
+            Accessor for the same dataframe in pure mode.
 
+        Examples
+        --------
+        >>> collection = pd.DataFrame({"Subject ID": ["100_S_1000"]})
+        >>> collection.adni.pure.rid()
+           Subject ID   RID
+        0  100_S_1000  1000
+        >>> collection
+           Subject ID
+        0  100_S_1000
+
+        """
+        accessor = ADNI(self._df)
+        accessor._pure = True  # pylint: disable=W0212
+
+        return accessor
+
+    def _frame(self):
+        """Get the dataframe, which the methods may change."""
+        if self._pure:
+            return self._df.copy(deep=False)
+
+        return self._df
+
+    @instrumented
     def standard_column_names(self):
         """Rename dataframe columns to module standard.
 
@@ -110,19 +240,26 @@ class ADNI:
         1    100002
 
         """
-        self._df = self._df.rename(mapper=self.MAPPER, axis="columns")
+        if self._pure:
+            dataframe = self._frame()
+            dataframe.rename(mapper=self.MAPPER, axis="columns", inplace=True)
+        else:
+            dataframe = self._df.rename(mapper=self.MAPPER, axis="columns")
 
-        if "VISCODE2" in self._df.columns:
-            self._df["VISCODE"] = self._df["VISCODE2"]
-            del self._df["VISCODE2"]
+        if "VISCODE2" in dataframe.columns:
+            dataframe["VISCODE"] = dataframe["VISCODE2"]
+            del dataframe["VISCODE2"]
 
         else:
             print('"VISCODE2" not included.')
 
-        self._df = self.rid()
+        dataframe = dataframe.adni.rid()
+        if not self._pure:
+            self._df = dataframe
 
-        return self._df
+        return dataframe
 
+    @instrumented
     def standard_dates(self):
         """Change type of date columns to datetime.
 
@@ -132,12 +269,48 @@ class ADNI:
             Dates will have the appropriate dtype.
 
         """
+        dataframe = self._frame()
         for date in self.DATES:
-            if date in self._df.columns:
-                self._df.loc[:, date] = pd.to_datetime(self._df.loc[:, date])
+            if date in dataframe.columns:
+                dataframe[date] = pd.to_datetime(dataframe[date])
 
-        return self._df
+        return dataframe
 
+    @instrumented
+    def standard_visits(self, column=None):
+        """Change visit codes to an ordered categorical with months.
+
+        Visits are then sorted by time, e.g. 'm12' before 'm102', and sorts
+        and joins compare small integer codes instead of strings.
+
+        Parameters
+        ----------
+        column : str, default None
+            Column of visit codes. By default 'VISCODE' if present,
+            otherwise 'VISCODE2'.
+
+        Returns
+        -------
+        pd.DataFrame
+            The column is an ordered categorical and 'VISMONTH' has the
+            months since baseline.
+
+        See Also
+        --------
+        parse_viscodes
+
+        """
+        dataframe = self._frame()
+        if column is None:
+            column = "VISCODE" if "VISCODE" in dataframe.columns else "VISCODE2"
+
+        visits = parse_viscodes(dataframe[column])
+        dataframe[column] = visits["VISCODE"]
+        dataframe["VISMONTH"] = visits["VISMONTH"]
+
+        return dataframe
+
+    @instrumented
     def standard_index(self, index=None):
         """Process dataframes into a standardized format.
 
@@ -170,10 +343,13 @@ class ADNI:
 
         return dataframe
 
+    @instrumented
     def rid(self):
         """Add a roster ID column.
 
         Will not work if 'RID' is already present or 'Subject ID' is missing.
+        The roster ID is the number after the last '_' of the 'Subject ID'.
+        It is parsed once for each subject.
 
         Returns
         -------
@@ -194,16 +370,22 @@ class ADNI:
         1  101_S_1001  1001
 
         """
-        collection = self._df
+        collection = self._frame()
         missing_rid = "RID" not in collection.columns
         contains_subject_id = "Subject ID" in collection.columns
         if missing_rid and contains_subject_id:
-            collection["RID"] = collection["Subject ID"].map(
-                lambda subject_id: pd.to_numeric(subject_id[-4:])
-            )
+            codes, subject_ids = pd.factorize(collection["Subject ID"])
+            rids = pd.to_numeric(
+                pd.Series(subject_ids, dtype=object).str.rsplit("_", n=1).str[-1]
+            ).to_numpy()
+            if (codes < 0).any():
+                # missing subjects are -1 and take the appended NaN
+                rids = np.append(rids.astype(np.float64), np.nan)
+            collection["RID"] = rids[codes]
 
         return collection
 
+    @instrumented
     def drop_dynamic(self):
         """Remove images which are dynamic.
 
@@ -219,6 +401,8 @@ class ADNI:
 
         return no_dynamic
 
+    @instrumented
+    @memoized()
     def groups(self, grouped_mci=True):
         """Create a dataframe for each group and save it to a csv file.
 
@@ -255,6 +439,101 @@ class ADNI:
 
         return groups
 
+    @instrumented
+    def one_per_timepoint(self, descriptions=None, visit=None, window=None, rules=None):
+        """Select one image per subject and timepoint.
+
+        Images are sorted by the priority rules and the first image of each
+        subject and timepoint is kept. By default the rules are
+        `PRIORITY_RULES`:
+
+        1. The position of 'Description' in descriptions, if passed.
+        2. The latest processing step in 'Type', see `PROCESSING_STEPS`.
+        3. The highest 'Image ID'.
+
+        Rules for missing columns are skipped.
+
+        Parameters
+        ----------
+        descriptions : list of str, default None
+            Preferred descriptions, the first one is preferred the most.
+            Other descriptions come after them.
+        visit : str, default None
+            Column of the timepoints. By default 'VISCODE' if present,
+            otherwise 'Visit'.
+        window : str or pd.Timedelta, default None
+            Instead of visits, use windows of this length since the first
+            'SCANDATE' of each subject as timepoints.
+        rules : list of tuple, default None
+            Pairs of a column and its order, the first pair is applied first.
+            The order is either a list of preferred values, where the first
+            value is preferred the most and other values come after them,
+            or a bool, whether lower values are preferred.
+            The rule for descriptions is applied before them.
+
+        Returns
+        -------
+        pd.DataFrame
+            The selected images in their original order.
+
+        See Also
+        --------
+        timepoints
+
+        Examples
+        --------
+        >>> collection = pd.DataFrame(
+        ...     {
+        ...         "Subject ID": ["101_S_1001", "101_S_1001", "101_S_1001"],
+        ...         "VISCODE": ["bl", "bl", "m12"],
+        ...         "Description": ["MPRAGE", "MT1; N3m", "MPRAGE"],
+        ...         "Image ID": [100001, 100002, 100003],
+        ...     }
+        ... )
+        >>> collection.adni.one_per_timepoint(descriptions=["MT1; N3m"])
+           Subject ID VISCODE Description  Image ID
+        1  101_S_1001      bl    MT1; N3m    100002
+        2  101_S_1001     m12      MPRAGE    100003
+
+        """
+        dataframe = self._df
+        if window is not None:
+            dates = dataframe["SCANDATE"]
+            first_dates = dates.groupby(dataframe["Subject ID"]).transform("min")
+            timepoint = (dates - first_dates) // pd.Timedelta(window)
+        else:
+            if visit is None:
+                visit = "VISCODE" if "VISCODE" in dataframe.columns else "Visit"
+            timepoint = dataframe[visit]
+
+        if rules is None:
+            rules = self.PRIORITY_RULES
+        if descriptions is not None:
+            rules = [("Description", descriptions), *rules]
+
+        keys = [dataframe["Subject ID"].to_numpy(), timepoint.to_numpy()]
+        ascending = [True, True]
+        for column, order in rules:
+            if column not in dataframe.columns:
+                continue
+            if isinstance(order, bool):
+                keys.append(dataframe[column].to_numpy())
+                ascending.append(order)
+            else:
+                order = list(order)
+                codes = pd.Categorical(dataframe[column], categories=order).codes
+                keys.append(np.where(codes < 0, len(order), codes))
+                ascending.append(True)
+
+        priorities = pd.DataFrame(dict(enumerate(keys)))
+        priorities = priorities.sort_values(
+            list(priorities.columns), ascending=ascending, kind="stable"
+        )
+        selected = priorities.drop_duplicates(subset=[0, 1])
+
+        return dataframe.iloc[np.sort(selected.index.to_numpy())]
+
+    @instrumented
     def longitudinal(self):
         """
         Keep only longitudinal data.
@@ -283,7 +562,350 @@ class ADNI:
 
         return longitudinal
 
-    def timepoints(self, second="first"):
+    @instrumented
+    def subject_summary(self, by=None, date=None):
+        """Aggregate scans per subject for `adnipy.summarize`.
+
+        The result of each chunk of a large file can be concatenated and
+        passed to `adnipy.summarize`, since subjects, which appear in several
+        chunks, are merged there.
+
+        Parameters
+        ----------
+        by : list of str, default None
+            Further columns to keep in the index, so that `adnipy.summarize`
+            can group by them, e.g. 'Modality'.
+        date : str, default None
+            Column with the date of each scan. By default 'SCANDATE' if
+            present, otherwise 'EXAMDATE'.
+
+        Returns
+        -------
+        pd.DataFrame
+            'scans' and the 'first' and 'last' date for each subject.
+            The index has the 'Subject ID' with the 'Group', the phase
+            'COLPROT' or 'Phase' and the columns of by, if present.
+
+        """
+        dataframe = self._df
+        if date is None:
+            date = "SCANDATE" if "SCANDATE" in dataframe.columns else "EXAMDATE"
+        keys = ["Subject ID", "Group", self._phase_column(), *(by or [])]
+        keys = [column for column in dict.fromkeys(keys) if column in dataframe.columns]
+
+        grouped = dataframe.groupby(keys, dropna=False, observed=True, sort=False)
+        aggregates = {"scans": ("Subject ID", "size")}
+        if date in dataframe.columns:
+            aggregates["first"] = (date, "min")
+            aggregates["last"] = (date, "max")
+
+        return grouped.agg(**aggregates)
+
+    @instrumented
+    def summary(self, by=None, date=None):
+        """Count subjects, scans and longitudinal spans per site and group.
+
+        The site is the prefix of the 'Subject ID', e.g. 101 for
+        '101_S_1001'. All aggregates are computed in one grouped pass.
+
+        Parameters
+        ----------
+        by : list of str, default None
+            Columns to group by, 'SITE' or columns of the dataframe.
+            By default 'SITE', 'Group' and the phase 'COLPROT' or 'Phase',
+            if present.
+        date : str, default None
+            Column with the date of each scan. By default 'SCANDATE' if
+            present, otherwise 'EXAMDATE'.
+
+        Returns
+        -------
+        pd.DataFrame
+            See `adnipy.summarize`.
+
+        Raises
+        ------
+        ValueError
+            If a column of by is missing.
+
+        See Also
+        --------
+        subject_summary
+
+        Examples
+        --------
+        >>> collection = pd.DataFrame(
+        ...     {
+        ...         "Subject ID": ["101_S_1001", "101_S_1001", "102_S_1002"],
+        ...         "Group": ["AD", "AD", "CN"],
+        ...         "SCANDATE": pd.to_datetime(
+        ...             ["2010-01-01", "2012-01-01", "2011-06-01"]
+        ...         ),
+        ...     }
+        ... )
+        >>> collection.adni.summary().round(2).reset_index()
+           SITE Group  subjects  scans  longitudinal  mean_span_years
+        0   101    AD         1      2             1              2.0
+        1   102    CN         1      1             0              NaN
+
+        """
+        # pylint: disable=C0415
+        from .adnipy import summarize
+
+        return summarize(self.subject_summary(by=by, date=date), by=by)
+
+    def _phase_column(self):
+        """Get the column of the study phase."""
+        return "COLPROT" if "COLPROT" in self._df.columns else "Phase"
+
+    @instrumented
+    def slopes(
+        self, columns, date="EXAMDATE", min_visits=2, n_jobs=1, backend="threads"
+    ):
+        """Fit a linear rate of change for each subject.
+
+        The least squares fit of each column over time is calculated for all
+        subjects at once from grouped sums. Missing values are ignored.
+
+        Parameters
+        ----------
+        columns : list of str
+            Columns to fit, like 'ADAS13' or 'MMSE'.
+            Values which are not numeric are treated as missing.
+        date : str, default 'EXAMDATE'
+            Column with the dates of the visits.
+        min_visits : int, default 2
+            Subjects with fewer visits with a value get no slope or intercept.
+        n_jobs : int, default 1
+            Number of workers. Subjects are fit in parallel, if not 1.
+            -1 uses all CPUs.
+        backend : {'threads', 'processes'}, default 'threads'
+            How the workers run in parallel. Threads suffice, since the
+            grouped sums run in numpy and pandas.
+
+        Returns
+        -------
+        pd.DataFrame
+            For each 'RID' and column the 'slope' per year, the 'intercept' at
+            the subject's first visit and the number 'n' of visits used.
+
+        Examples
+        --------
+        >>> adnimerge = pd.DataFrame(
+        ...     {
+        ...         "RID": [1001, 1001, 1001, 1002],
+        ...         "EXAMDATE": ["2001-01-01", "2002-01-01", "2003-01-01", "2002-1-1"],
+        ...         "MMSE": [29, 27, None, 30],
+        ...     }
+        ... )
+        >>> adnimerge.adni.slopes(["MMSE"])["MMSE"].round(2).reset_index()
+            RID  slope  intercept  n
+        0  1001   -2.0       29.0  2
+        1  1002    NaN        NaN  1
+
+        """
+        dataframe = self.rid()
+        if n_jobs != 1:
+            return parallel.map_subjects(
+                _slopes,
+                [dataframe],
+                n_jobs=n_jobs,
+                key="RID",
+                backend=backend,
+                args=(columns, date, min_visits),
+            )
+
+        subjects = dataframe["RID"]
+
+        dates = pd.to_datetime(dataframe[date])
+        first_dates = dates.groupby(subjects).transform("min")
+        years = ((dates - first_dates).dt.days / 365.25).to_numpy()
+
+        values = dataframe[columns].apply(pd.to_numeric, errors="coerce").to_numpy()
+        valid = ~np.isnan(values) & ~np.isnan(years)[:, np.newaxis]
+        time = np.where(valid, years[:, np.newaxis], 0.0)
+        values = np.where(valid, values, 0.0)
+
+        stats = ["n", "t", "y", "tt", "ty"]
+        terms = np.concatenate(
+            [valid, time, values, time * time, time * values], axis=1
+        )
+        sums = pd.DataFrame(
+            terms,
+            index=subjects,
+            columns=pd.MultiIndex.from_product([stats, columns]),
+        )
+        sums = sums.groupby(level=0).sum()
+        n, t, y, tt, ty = (sums[stat] for stat in stats)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope = (n * ty - t * y) / (n * tt - t * t)
+            intercept = (y - slope * t) / n
+        enough_visits = n >= min_visits
+        slope = slope.where(enough_visits & np.isfinite(slope))
+        intercept = intercept.where(enough_visits & np.isfinite(intercept))
+
+        fits = pd.concat(
+            {"slope": slope, "intercept": intercept, "n": n.astype(np.int64)},
+            axis="columns",
+        )
+        fits = fits.swaplevel(axis="columns")[columns]
+
+        return fits
+
+    @instrumented
+    def to_tensor(self, features, visits="VISCODE", path=None, dtype=np.float64):
+        """Export features to an array of subjects x visits x features.
+
+        The rows are scattered into the array in a single pass.
+        If a visit of a subject appears more than once, the last row is used.
+
+        Parameters
+        ----------
+        features : list of str
+            Columns to export. Values which are not numeric become NaN.
+        visits : str, default 'VISCODE'
+            Column identifying the visit of each row. Visit codes are sorted
+            by time, see `parse_viscodes`.
+        path : str, pathlib.Path, default None
+            If given, the values are written to a memory-mapped .npy file.
+        dtype : numpy.dtype, default numpy.float64
+            Floating point data type of the values.
+
+        Returns
+        -------
+        values : np.ndarray
+            Array of shape subjects x visits x features.
+            Visits without data are NaN.
+        mask : np.ndarray
+            Boolean array of shape subjects x visits, which is true for visits
+            present in the dataframe.
+        rids : np.ndarray
+            The 'RID' for each position of the first axis.
+        viscodes : np.ndarray
+            The visit for each position of the second axis.
+
+        Examples
+        --------
+        >>> adnimerge = pd.DataFrame(
+        ...     {
+        ...         "RID": [1001, 1001, 1002],
+        ...         "VISCODE": ["bl", "m06", "bl"],
+        ...         "MMSE": [29, 28, 30],
+        ...     }
+        ... )
+        >>> values, mask, rids, viscodes = adnimerge.adni.to_tensor(["MMSE"])
+        >>> values[:, :, 0]
+        array([[29., 28.],
+               [30., nan]])
+        >>> mask
+        array([[ True,  True],
+               [ True, False]])
+        >>> rids, viscodes
+        (array([1001, 1002]), array(['bl', 'm06'], dtype=object))
+
+        """
+        if not np.issubdtype(dtype, np.floating):
+            raise ValueError(
+                f"dtype must be a floating point type to hold NaN, got {dtype}."
+            )
+
+        dataframe = self.rid()
+
+        subjects, rids = pd.factorize(dataframe["RID"], sort=True)
+        visit_values = dataframe[visits]
+        if pd.api.types.is_string_dtype(visit_values) and not isinstance(
+            visit_values.dtype, pd.CategoricalDtype
+        ):
+            visit_values = parse_viscodes(visit_values)["VISCODE"]
+        visit_slots, viscodes = pd.factorize(visit_values, sort=True)
+        present = (subjects >= 0) & (visit_slots >= 0)
+        subjects = subjects[present]
+        visit_slots = visit_slots[present]
+
+        shape = (len(rids), len(viscodes), len(features))
+        if path is None:
+            values = np.full(shape, np.nan, dtype=dtype)
+        else:
+            values = np.lib.format.open_memmap(
+                path, mode="w+", dtype=dtype, shape=shape
+            )
+            values.fill(np.nan)
+
+        feature_values = dataframe[features].apply(pd.to_numeric, errors="coerce")
+        values[subjects, visit_slots] = feature_values.to_numpy(dtype=dtype)[present]
+
+        if path is not None:
+            values.flush()
+
+        mask = np.zeros(shape[:2], dtype=bool)
+        mask[subjects, visit_slots] = True
+
+        return values, mask, np.asarray(rids), np.asarray(viscodes)
+
+    @instrumented
+    def to_arrow(self, columns=None, preserve_index=None):
+        """Export the dataframe to an Arrow record batch.
+
+        Numeric and datetime columns without missing values share their
+        memory with the dataframe. Other columns are converted.
+        Requires pyarrow.
+
+        Parameters
+        ----------
+        columns : list of str, default None
+            Columns to export. By default all columns.
+        preserve_index : bool, default None
+            Whether to store the index as columns. By default only an index,
+            which is not a RangeIndex, is stored.
+
+        Returns
+        -------
+        pyarrow.RecordBatch
+            The columns of the dataframe.
+
+        """
+        # Third party imports
+        import pyarrow as pa  # pylint: disable=C0415
+
+        return pa.RecordBatch.from_pandas(
+            self._df, columns=columns, preserve_index=preserve_index
+        )
+
+    @instrumented
+    def to_ipc(self, path, columns=None, preserve_index=None):
+        """Write the dataframe to an Arrow IPC file.
+
+        The file can be memory-mapped by `adnipy.read_ipc` in other
+        processes, so that they share the numeric and datetime columns
+        without copying or unpickling them. Requires pyarrow.
+
+        Parameters
+        ----------
+        path : str, pathlib.Path
+            The .arrow file.
+        columns : list of str, default None
+            Columns to export. By default all columns.
+        preserve_index : bool, default None
+            Whether to store the index as columns. By default only an index,
+            which is not a RangeIndex, is stored.
+
+        See Also
+        --------
+        to_arrow
+
+        """
+        # Third party imports
+        import pyarrow as pa  # pylint: disable=C0415
+
+        batch = self.to_arrow(columns=columns, preserve_index=preserve_index)
+        with pa.OSFile(str(path), "wb") as sink:
+            with pa.ipc.new_file(sink, batch.schema) as writer:
+                writer.write_batch(batch)
+
+    @instrumented
+    @memoized(pure_only=True)
+    def timepoints(self, second="first", n_jobs=1, backend="processes"):
         """Extract timepoints from a dataframe.
 
         Parameters
@@ -291,9 +913,25 @@ class ADNI:
         second : {'first' or 'last'}, default 'first'
             'last' to have the latest, 'first' to have the earliest values
             for timepoint 2.
+        n_jobs : int, default 1
+            Number of workers. Subjects are processed in parallel, if not 1.
+            The dataframe is not changed then. -1 uses all CPUs.
+        backend : {'threads', 'processes'}, default 'processes'
+            How the workers run in parallel. Threads do not speed up this
+            method, since it loops in Python and holds the global
+            interpreter lock.
 
         """
-        dataframe = self._df
+        if n_jobs != 1:
+            return parallel.map_subjects(
+                _timepoints,
+                [self._df],
+                n_jobs=n_jobs,
+                backend=backend,
+                args=(second,),
+            )
+
+        dataframe = self._frame()
 
         dataframe.reset_index(inplace=True)
         dataframe.set_index(self.INDEX, inplace=True)
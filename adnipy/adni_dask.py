@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+
+"""Dask dataframe extension for ADNI.
+
+Importing this module registers the `adni` accessor for Dask dataframes.
+The methods work on each partition with the pandas `ADNI` accessor.
+Methods, which need all rows of a subject, shuffle the data by subject first.
+"""
+
+# Standard library imports
+import warnings
+
+# Third party imports
+import dask.dataframe as dd
+
+from . import adnipy
+from .adni import ADNI
+
+MATCHING_COLUMNS = ["Subject ID", "SCANDATE", "Image ID"]
+
+
+def _apply(partition, method, *args):
+    """Call a method of the pandas accessor without changing the partition."""
+    return getattr(partition.adni.pure, method)(*args)
+
+
+@dd.extensions.register_dataframe_accessor("adni")
+class DaskADNI:
+    """Dask dataframe deals with ADNI data.
+
+    This class presents methods of `ADNI` for dataframes, which do not fit
+    into memory.
+    """
+
+    DATES = ADNI.DATES
+    INDEX = ADNI.INDEX
+    MAPPER = ADNI.MAPPER
+
+    def __init__(self, dask_dataframe):
+        """Pass dataframe to the _df attribute of DaskADNI object.
+
+        Parameters
+        ----------
+        dask_dataframe : dd.DataFrame
+            This dataframe will be stored in the _df attribute.
+
+        """
+        self._df = dask_dataframe
+
+    def _map_partitions(self, method, *args, dataframe=None):
+        """Apply a method of the pandas accessor to each partition."""
+        if dataframe is None:
+            dataframe = self._df
+        meta = _apply(dataframe._meta, method, *args)  # pylint: disable=W0212
+        result = dataframe.map_partitions(_apply, method, *args, meta=meta)
+        if "RID" in meta.columns and "RID" not in dataframe.columns:
+            # partitions with missing subjects have float roster IDs
+            result = result.astype({"RID": "float64"})
+
+        return result
+
+    def standard_column_names(self):
+        """Rename dataframe columns to module standard.
+
+        Returns
+        -------
+        dd.DataFrame
+            This will have standardized columns names.
+
+        See Also
+        --------
+        ADNI.standard_column_names
+
+        """
+        mapper = {
+            column: self.MAPPER[column]
+            for column in self._df.columns
+            if column in self.MAPPER
+        }
+        dataframe = self._df.rename(columns=mapper)
+
+        if "VISCODE2" in dataframe.columns:
+            dataframe = dataframe.assign(VISCODE=dataframe["VISCODE2"])
+            dataframe = dataframe.drop(columns="VISCODE2")
+
+        else:
+            print('"VISCODE2" not included.')
+
+        return dataframe.adni.rid()
+
+    def standard_dates(self):
+        """Change type of date columns to datetime.
+
+        Returns
+        -------
+        dd.DataFrame
+            Dates will have the appropriate dtype.
+
+        """
+        return self._map_partitions("standard_dates")
+
+    def rid(self):
+        """Add a roster ID column.
+
+        Returns
+        -------
+        dd.DataFrame
+            Dataframe with a 'RID' column.
+
+        """
+        return self._map_partitions("rid")
+
+    def drop_dynamic(self):
+        """Remove images which are dynamic.
+
+        Returns
+        -------
+        dd.DataFrame
+            All images that are not dynamic.
+
+        """
+        return self._map_partitions("drop_dynamic")
+
+    def longitudinal(self, npartitions=None):
+        """Keep only longitudinal data.
+
+        The rows are shuffled, so that all rows of a subject are in the same
+        partition. The order of the rows is not kept.
+
+        Parameters
+        ----------
+        npartitions : int, default None
+            Number of partitions after shuffling.
+            By default the number of partitions is kept.
+
+        Returns
+        -------
+        dd.DataFrame
+            A dataframe with only longitudinal data.
+
+        """
+        dataframe = self.rid()
+        dataframe = dataframe.shuffle(on="RID", npartitions=npartitions)
+
+        return self._map_partitions("longitudinal", dataframe=dataframe)
+
+
+def _matching_images(left, right):
+    """Match the images of a pair of partitions."""
+    right = right[MATCHING_COLUMNS]
+    if left["Subject ID"].isin(right["Subject ID"]).any():
+        matching_images = adnipy.get_matching_images(left, right)
+        return matching_images.reset_index()
+
+    if not left.empty:
+        missing_match = set(zip(left["Subject ID"], left["SCANDATE"]))
+        message = "Could not find matching images for:" + str(missing_match)
+        warnings.warn(message, stacklevel=1)
+
+    matching_images = left.iloc[:0].set_index(["Subject ID", "SCANDATE"])
+    matching_images = matching_images.reset_index()
+    matching_images = matching_images.rename(columns={"Image ID": "Image ID_l"})
+    matching_images["Image ID_r"] = right["Image ID"].iloc[:0].to_numpy()
+
+    return matching_images
+
+
+def get_matching_images(left, right, npartitions=None):
+    """Match different scan types based on closest date.
+
+    Both dataframes are shuffled by 'Subject ID' into the same number of
+    partitions, so that each pair of partitions can be matched independently.
+    All columns of left are kept, of right only 'Image ID' is used.
+
+    Parameters
+    ----------
+    left : dd.DataFrame
+        Dataframe containing the tau scans.
+    right : dd.DataFrame
+        Dataframe containing the mri scans.
+    npartitions : int, default None
+        Number of partitions after shuffling.
+        By default the larger number of partitions of the inputs.
+
+    Returns
+    -------
+    dd.DataFrame
+        For each timepoint there is a match from both inputs.
+        Unlike `adnipy.get_matching_images`, 'Subject ID' and 'SCANDATE' are
+        columns, since Dask does not support a MultiIndex.
+
+    See Also
+    --------
+    adnipy.get_matching_images
+
+    """
+    if npartitions is None:
+        npartitions = max(left.npartitions, right.npartitions)
+
+    left = left.shuffle(on="Subject ID", npartitions=npartitions)
+    right = right[MATCHING_COLUMNS].shuffle(on="Subject ID", npartitions=npartitions)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        meta = _matching_images(left._meta, right._meta)  # pylint: disable=W0212
+
+    return dd.map_partitions(
+        _matching_images, left, right, meta=meta, align_dataframes=False
+    )
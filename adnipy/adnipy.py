@@ -6,10 +6,18 @@
 import warnings
 
 # Third party imports
+import numpy as np
 import pandas as pd
 
+# Registers the 'adni' dataframe accessor
+from . import adni  # noqa: F401 pylint: disable=W0611
+from . import parallel
+from .cache import memoized
+from .instrumentation import instrumented
 
-def read_csv(file):
+
+@instrumented
+def read_csv(file, chunksize=None, dtype=None):
     """Return a csv file as a pandas.DataFrame.
 
     Recognizes missing values used in the ADNI database.
@@ -18,11 +26,16 @@ def read_csv(file):
     ----------
     file : str, pathlib.Path
         The path to the .csv file.
+    chunksize : int, default None
+        Read the file in chunks of this many rows.
+    dtype : dict, default None
+        Data types of columns, which are added to the defaults.
 
     Returns
     -------
-    pd.DataFrame
-        Returns the file as a dataframe.
+    pd.DataFrame or pd.io.parsers.TextFileReader
+        Returns the file as a dataframe or, if chunksize is given,
+        an iterator of dataframes.
 
     See Also
     --------
@@ -35,19 +48,59 @@ def read_csv(file):
     na_values = ["-1", "-4"]
 
     # prevents UserWarnings on large files like ADNIMERGE
-    dtype = {
+    dtypes = {
         "ABETA": object,
         "TAU": object,
         "TAU_bl": object,
         "PTAU": object,
         "PTAU_bl": object,
     }
+    if dtype is not None:
+        dtypes.update(dtype)
 
-    dataframe = pd.read_csv(file, dtype=dtype, na_values=na_values)
+    dataframe = pd.read_csv(
+        file, dtype=dtypes, na_values=na_values, chunksize=chunksize
+    )
 
     return dataframe
 
 
+@instrumented
+def read_ipc(file, memory_map=True, columns=None):
+    """Return an Arrow IPC file as a pandas.DataFrame.
+
+    If the file is memory-mapped, numeric and datetime columns without
+    missing values are not copied into memory. Their pages are shared with
+    all processes mapping the same file. Requires pyarrow.
+
+    Parameters
+    ----------
+    file : str, pathlib.Path
+        The path to the .arrow file, e.g. written by `ADNI.to_ipc`.
+    memory_map : bool, default True
+        Whether to memory-map the file instead of reading it.
+    columns : list of str, default None
+        Columns to read. By default all columns.
+
+    Returns
+    -------
+    pd.DataFrame
+        Returns the file as a dataframe.
+
+    """
+    # Third party imports
+    import pyarrow as pa  # pylint: disable=C0415
+
+    source = pa.memory_map(str(file)) if memory_map else pa.OSFile(str(file))
+    with source:
+        table = pa.ipc.open_file(source).read_all()
+    if columns is not None:
+        table = table.select(columns)
+
+    return table.to_pandas(split_blocks=True)
+
+
+@instrumented
 def timedelta(old, new):
     """Get timedelta between timepoints.
 
@@ -75,7 +128,110 @@ def timedelta(old, new):
     return timedeltas
 
 
-def get_matching_images(left, right):
+@instrumented
+def timedelta_matrix(dataframe, date="SCANDATE", as_array=False):
+    """Get timedeltas between all timepoints of each subject.
+
+    The timepoints of a subject are its rows ordered by date.
+    Rows with the same date are separate timepoints in their original order.
+
+    Parameters
+    ----------
+    dataframe : pd.DataFrame
+        Requires 'Subject ID' and the date as columns or index levels.
+    date : str, default 'SCANDATE'
+        Column with the dates of the timepoints.
+    as_array : bool, default False
+        If true, return the subjects and a 3 dimensional array instead
+        of a long dataframe.
+
+    Returns
+    -------
+    pd.DataFrame or tuple of pd.Index and np.ndarray
+        The dataframe has the columns 'Subject ID', 'From', 'To' and
+        'Timedelta' with one row for each pair of timepoints.
+        Rows where 'From' is 1 contain the time since baseline.
+        The array has the shape subjects x timepoints x timepoints,
+        where ``array[s, i, j]`` is the date of timepoint ``j`` minus the date
+        of timepoint ``i``. Missing timepoints are NaT.
+
+    See Also
+    --------
+    timedelta
+
+    Examples
+    --------
+    >>> scans = pd.DataFrame(
+    ...     {
+    ...         "Subject ID": ["101_S_1001", "102_S_1002", "101_S_1001"],
+    ...         "SCANDATE": pd.to_datetime(["2001-01-01", "2002-01-01", "2001-07-01"]),
+    ...     }
+    ... )
+    >>> timedelta_matrix(scans)
+       Subject ID  From  To Timedelta
+    0  101_S_1001     1   2  181 days
+
+    """
+
+    def values(column):
+        """Get values of a column or index level."""
+        if column in dataframe.columns:
+            return dataframe[column].to_numpy()
+        return dataframe.index.get_level_values(column).to_numpy()
+
+    dates = values(date).astype("datetime64[ns]")
+    subject_ids = values("Subject ID")
+    dated = ~np.isnat(dates) & pd.notna(subject_ids)
+    codes, subjects = pd.factorize(subject_ids[dated], sort=True)
+    dates = dates[dated]
+
+    order = np.lexsort((dates, codes))
+    codes = codes[order]
+    dates = dates[order]
+
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    counts = np.diff(np.r_[starts, len(codes)])
+    timepoints = np.arange(len(codes)) - np.repeat(starts, counts)
+
+    if as_array:
+        total_timepoints = counts.max() if len(counts) else 0
+        matrix = np.full((len(subjects), total_timepoints), np.datetime64("NaT", "ns"))
+        matrix[codes, timepoints] = dates
+        deltas = matrix[:, np.newaxis, :] - matrix[:, :, np.newaxis]
+        return pd.Index(subjects, name="Subject ID"), deltas
+
+    # each timepoint is paired with the later timepoints of its subject,
+    # so memory grows with the number of pairs instead of the busiest subject
+    later = np.repeat(counts, counts) - 1 - timepoints
+    first = np.repeat(np.arange(len(codes)), later)
+    pair_starts = np.cumsum(later) - later
+    second = first + 1 + np.arange(len(first)) - np.repeat(pair_starts, later)
+    timedeltas = pd.DataFrame(
+        {
+            "Subject ID": subjects[codes[first]],
+            "From": timepoints[first] + 1,
+            "To": timepoints[second] + 1,
+            "Timedelta": dates[second] - dates[first],
+        }
+    )
+
+    return timedeltas
+
+
+MISSING_MATCH = "Could not find matching images for:"
+
+
+def _warn_missing_match(missing_match):
+    """Warn about images of the left dataframe without a match."""
+    if missing_match:
+        missing_match_str = str(set(missing_match))
+        message = MISSING_MATCH + missing_match_str
+        warnings.warn(message, stacklevel=2)
+
+
+@instrumented
+@memoized()
+def get_matching_images(left, right, n_jobs=1, backend="processes"):
     """Match different scan types based on closest date.
 
     The columns 'Subject ID' and 'SCANDATE' are required.
@@ -86,6 +242,12 @@ def get_matching_images(left, right):
         Dataframe containing the tau scans.
     right : pd.DataFrame
         Dataframe containing the mri scans.
+    n_jobs : int, default 1
+        Number of workers. Subjects are matched in parallel, if not 1.
+        -1 uses all CPUs.
+    backend : {'threads', 'processes'}, default 'processes'
+        How the workers run in parallel. Threads do not speed up matching,
+        since it loops in Python and holds the global interpreter lock.
 
     Returns
     -------
@@ -93,6 +255,23 @@ def get_matching_images(left, right):
         For each timepoint there is a match from both inputs.
 
     """
+    if n_jobs != 1:
+        # the missing matches of all shards are merged into one warning
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message=MISSING_MATCH)
+            matching_images_df = parallel.map_subjects(
+                get_matching_images, [left, right], n_jobs=n_jobs, backend=backend
+            )
+        right_subjects = set(right["Subject ID"])
+        _warn_missing_match(
+            [
+                index
+                for index in zip(left["Subject ID"], left["SCANDATE"])
+                if index[0] not in right_subjects
+            ]
+        )
+        return matching_images_df
+
     left = left.set_index(["Subject ID", "SCANDATE"])
     left = left.sort_index()
 
@@ -121,12 +300,203 @@ def get_matching_images(left, right):
         else:
             missing_match.append(index)
 
+    if not matching_images:
+        image = left.iloc[:0].copy()
+        image["Image ID_r"] = right["Image ID"].iloc[:0].to_numpy()
+        matching_images.append(image)
+
     matching_images_df = pd.concat(matching_images)
     matching_images_df = matching_images_df.rename(columns={"Image ID": "Image ID_l"})
 
-    if missing_match:
-        missing_match_str = str(set(missing_match))
-        message = "Could not find matching images for:" + missing_match_str
-        warnings.warn(message, stacklevel=1)
+    _warn_missing_match(missing_match)
 
     return matching_images_df
+
+
+@instrumented
+def match_visits(images, adnimerge, columns=None, tolerance=None, direction="nearest"):
+    """Match images to the closest clinical visit of the same subject.
+
+    The 'SCANDATE' of each image is compared to the 'EXAMDATE' of the
+    visits in ADNIMERGE, which share its 'RID'.
+    All subjects are matched at once with an as-of join.
+
+    Parameters
+    ----------
+    images : pd.DataFrame
+        Collection with 'SCANDATE' and 'RID' or 'Subject ID' columns.
+    adnimerge : pd.DataFrame
+        Clinical data with 'RID' and 'EXAMDATE' columns.
+    columns : list of str, default None
+        Columns of ADNIMERGE to add to the images.
+        By default all columns are added.
+    tolerance : str or pd.Timedelta, default None
+        Visits further away from the scan are not matched.
+    direction : {'nearest', 'backward', 'forward'}, default 'nearest'
+        'backward' only matches visits on or before the scan,
+        'forward' only visits on or after the scan.
+
+    Returns
+    -------
+    pd.DataFrame
+        The images with the clinical columns of the matched visit.
+        Columns already present in images get the suffix '_r'.
+        Images without a matching visit have missing values.
+
+    See Also
+    --------
+    get_matching_images
+
+    Examples
+    --------
+    >>> images = pd.DataFrame(
+    ...     {
+    ...         "Subject ID": ["101_S_1001", "101_S_1001", "102_S_1002"],
+    ...         "SCANDATE": pd.to_datetime(["2001-01-10", "2002-02-01", "2005-01-01"]),
+    ...     }
+    ... )
+    >>> adnimerge = pd.DataFrame(
+    ...     {
+    ...         "RID": [1001, 1001, 1002],
+    ...         "VISCODE": ["bl", "m12", "bl"],
+    ...         "EXAMDATE": pd.to_datetime(["2001-01-01", "2002-01-01", "2002-01-01"]),
+    ...     }
+    ... )
+    >>> match_visits(images, adnimerge, columns=["VISCODE"], tolerance="180D")
+       Subject ID   SCANDATE   RID   EXAMDATE VISCODE
+    0  101_S_1001 2001-01-10  1001 2001-01-01      bl
+    1  101_S_1001 2002-02-01  1001 2002-01-01     m12
+    2  102_S_1002 2005-01-01  1002        NaT     NaN
+
+    """
+    images = images.adni.pure.rid()
+
+    if columns is None:
+        columns = adnimerge.columns
+    # the keys of the join are always added once
+    columns = [column for column in columns if column not in ("RID", "EXAMDATE")]
+    if tolerance is not None:
+        tolerance = pd.Timedelta(tolerance)
+
+    matched = images["RID"].notna() & images["SCANDATE"].notna()
+    left = pd.DataFrame(
+        {
+            "RID": images.loc[matched, "RID"].to_numpy(dtype=np.int64),
+            # both keys of merge_asof need the same unit
+            "SCANDATE": images.loc[matched, "SCANDATE"].to_numpy(
+                dtype="datetime64[ns]"
+            ),
+            "position": np.flatnonzero(matched.to_numpy()),
+        }
+    )
+    left = left.sort_values("SCANDATE", kind="mergesort")
+
+    right = adnimerge[["RID", "EXAMDATE"] + columns]
+    right = right[right["RID"].notna() & right["EXAMDATE"].notna()]
+    right = right.astype({"RID": np.int64, "EXAMDATE": "datetime64[ns]"})
+    right = right.sort_values("EXAMDATE", kind="mergesort")
+    right = right.rename(
+        columns={column: column + "_r" for column in columns if column in images}
+    )
+
+    visits = pd.merge_asof(
+        left,
+        right,
+        left_on="SCANDATE",
+        right_on="EXAMDATE",
+        by="RID",
+        tolerance=tolerance,
+        direction=direction,
+    )
+    visits = visits.drop(columns=["RID", "SCANDATE"]).set_index("position")
+    if "EXAMDATE" in images.columns:
+        visits = visits.rename(columns={"EXAMDATE": "EXAMDATE_r"})
+    visits = visits.reindex(np.arange(len(images)))
+    visits.index = images.index
+
+    return pd.concat([images, visits], axis="columns")
+
+
+@instrumented
+def summarize(subject_summaries, by=None):
+    """Count subjects, scans and longitudinal spans per site and group.
+
+    Parameters
+    ----------
+    subject_summaries : pd.DataFrame or iterable of pd.DataFrame
+        Outputs of `ADNI.subject_summary`, e.g. one for each chunk of a file.
+        Subjects in several of them are merged first.
+    by : list of str, default None
+        Columns to group by, 'SITE' or levels of the index of the subject
+        summaries. Further columns must be passed to `ADNI.subject_summary`.
+        By default 'SITE', 'Group' and the phase 'COLPROT' or 'Phase',
+        if present.
+
+    Returns
+    -------
+    pd.DataFrame
+        For each group the number of 'subjects', 'scans' and 'longitudinal'
+        subjects with more than one scan and, if dates are known, the
+        'mean_span_years' between the first and last scan of the
+        longitudinal subjects.
+
+    Raises
+    ------
+    ValueError
+        If a column of by is missing.
+
+    See Also
+    --------
+    ADNI.summary
+
+    Examples
+    --------
+    >>> chunks = [
+    ...     pd.DataFrame({"Subject ID": ["101_S_1001"], "Group": ["AD"]}),
+    ...     pd.DataFrame({"Subject ID": ["101_S_1001"], "Group": ["AD"]}),
+    ... ]
+    >>> summarize(chunk.adni.subject_summary() for chunk in chunks).reset_index()
+       SITE Group  subjects  scans  longitudinal
+    0   101    AD         1      2             1
+
+    """
+    if isinstance(subject_summaries, pd.DataFrame):
+        subject_summaries = [subject_summaries]
+    partials = pd.concat(list(subject_summaries))
+
+    aggregates = {"scans": ("scans", "sum")}
+    if "first" in partials.columns:
+        aggregates["first"] = ("first", "min")
+        aggregates["last"] = ("last", "max")
+    subjects = partials.groupby(
+        level=list(range(partials.index.nlevels)), dropna=False, observed=True
+    ).agg(**aggregates)
+    subjects = subjects.reset_index()
+
+    # sites are parsed once per subject instead of once per scan
+    subjects["SITE"] = pd.to_numeric(subjects["Subject ID"].str[:3], errors="coerce")
+    if by is None:
+        by = [
+            column
+            for column in ["SITE", "Group", "COLPROT", "Phase"]
+            if column in subjects.columns
+        ]
+    missing = [column for column in by if column not in subjects.columns]
+    if missing:
+        raise ValueError(
+            f"Can not group by {missing}, since the subject summaries do not "
+            "contain them."
+        )
+
+    subjects["longitudinal"] = subjects["scans"] > 1
+    aggregates = {
+        "subjects": ("Subject ID", "size"),
+        "scans": ("scans", "sum"),
+        "longitudinal": ("longitudinal", "sum"),
+    }
+    if "first" in subjects.columns:
+        span = (subjects["last"] - subjects["first"]) / pd.Timedelta(days=365.25)
+        subjects["span"] = span.where(subjects["longitudinal"])
+        aggregates["mean_span_years"] = ("span", "mean")
+
+    return subjects.groupby(by, dropna=False, observed=True).agg(**aggregates)
@@ -0,0 +1,377 @@
+# -*- coding: utf-8 -*-
+
+"""Cache results of adnipy functions on unchanged dataframes.
+
+Caching is opt-in. While a cache is active, cached functions look up their
+result by a fingerprint of their input dataframes and their other arguments.
+The fingerprint hashes the index and all columns, so changed values are
+noticed, even if they were changed in place. Functions, which only return
+some columns, may declare them as relevant. Other columns are identified by
+their memory then, so replacing them is noticed, but changing their values
+in place is not.
+Results are shared between calls, so they should not be changed in place.
+Warnings of a call are stored with its result and are emitted again by hits.
+"""
+
+# Standard library imports
+import collections
+import contextlib
+import functools
+import hashlib
+import threading
+import warnings
+
+# Third party imports
+import numpy as np
+import pandas as pd
+
+from .instrumentation import _frames
+
+_active = []
+_local = threading.local()
+
+
+class ResultCache:
+    """Least recently used cache of results.
+
+    Parameters
+    ----------
+    max_entries : int, default 128
+        Maximum number of results.
+    max_bytes : int, default 2**30
+        Maximum memory of the dataframes in all results.
+        Object columns are counted by their pointers only.
+
+    Attributes
+    ----------
+    hits : int
+        Number of calls, which returned a cached result.
+    misses : int
+        Number of calls, which computed the result.
+
+    """
+
+    def __init__(self, max_entries=128, max_bytes=2**30):
+        """Create an empty cache."""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Get the number of cached results."""
+        return len(self._entries)
+
+    def get(self, key):
+        """Get a result and mark it as recently used.
+
+        Returns
+        -------
+        tuple
+            Whether the key was found and the result or None.
+
+        """
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return True, self._entries[key][0]
+
+    def put(self, key, result, keep=()):
+        """Store a result and evict the least recently used results.
+
+        Objects in keep stay alive as long as the result, so that memory
+        addresses in the key are not reused.
+        """
+        nbytes = sum(
+            (
+                frame.memory_usage(index=True, deep=False).sum()
+                if isinstance(frame, pd.DataFrame)
+                else frame.memory_usage(index=True, deep=False)
+            )
+            for frame in _frames(result)
+        )
+        if nbytes > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key)[1]
+            self._entries[key] = (result, nbytes, keep)
+            self.nbytes += nbytes
+            while len(self._entries) > self.max_entries or self.nbytes > self.max_bytes:
+                _, (_, evicted_bytes, _) = self._entries.popitem(last=False)
+                self.nbytes -= evicted_bytes
+
+    def clear(self):
+        """Remove all results and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Get the statistics of the cache.
+
+        Returns
+        -------
+        dict
+            'hits', 'misses', 'hit_rate', 'entries' and 'bytes'.
+
+        """
+        calls = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / calls if calls else 0.0,
+            "entries": len(self),
+            "bytes": self.nbytes,
+        }
+
+
+def enable(max_entries=128, max_bytes=2**30):
+    """Cache results of all calls until `disable` is called.
+
+    Parameters
+    ----------
+    max_entries : int, default 128
+        Maximum number of results.
+    max_bytes : int, default 2**30
+        Maximum memory of all results.
+
+    Returns
+    -------
+    ResultCache
+        The active cache.
+
+    """
+    cache = ResultCache(max_entries, max_bytes)
+    _active[:] = [cache]
+    return cache
+
+
+def disable():
+    """Stop caching results."""
+    _active.clear()
+
+
+@contextlib.contextmanager
+def cached(max_entries=128, max_bytes=2**30):
+    """Cache results inside of a with statement.
+
+    Parameters
+    ----------
+    max_entries : int, default 128
+        Maximum number of results.
+    max_bytes : int, default 2**30
+        Maximum memory of all results.
+
+    Yields
+    ------
+    ResultCache
+        The active cache.
+
+    Examples
+    --------
+    >>> collection = pd.DataFrame({"Group": ["AD", "CN", "AD"]})
+    >>> with cached() as cache:
+    ...     first = collection.adni.groups()
+    ...     second = collection.adni.groups()
+    >>> cache.hits, cache.misses
+    (1, 1)
+
+    """
+    previous = list(_active)
+    cache = enable(max_entries, max_bytes)
+    try:
+        yield cache
+    finally:
+        _active[:] = previous
+
+
+@contextlib.contextmanager
+def bypassed():
+    """Call cached functions without the cache in this thread.
+
+    `adnipy.parallel.map_subjects` uses this, so that the results of single
+    shards are not cached.
+    """
+    _local.depth = getattr(_local, "depth", 0) + 1
+    try:
+        yield
+    finally:
+        _local.depth -= 1
+
+
+def _hash_index(index):
+    """Hash the labels and names of an index."""
+    if isinstance(index, pd.RangeIndex):
+        return repr((index.start, index.stop, index.step, index.name)).encode()
+
+    return (
+        repr(list(index.names)).encode()
+        + pd.util.hash_pandas_object(index, index=False).to_numpy().tobytes()
+    )
+
+
+def _memory(values):
+    """Get the memory of a numpy array or None for other arrays."""
+    if isinstance(values, np.ndarray):
+        return values.__array_interface__["data"][0], values.strides, values.shape
+
+    return None
+
+
+def fingerprint(frame, columns=None, keep=None):
+    """Hash the index and columns of a dataframe or series.
+
+    Parameters
+    ----------
+    frame : pd.DataFrame or pd.Series
+    columns : list of str, default None
+        The values of these columns are hashed. The other columns are
+        identified by their memory, if they are numpy arrays, and hashed
+        otherwise. By default all columns are hashed.
+    keep : list, default None
+        Arrays identified by their memory are appended, so that they can be
+        kept alive with the cached result.
+
+    Returns
+    -------
+    str
+        Equal for frames with equal content.
+
+    Raises
+    ------
+    TypeError
+        If values can not be hashed.
+
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(type(frame)).encode())
+    digest.update(_hash_index(frame.index))
+    if isinstance(frame, pd.Series):
+        digest.update(repr((frame.name, frame.dtype)).encode())
+        digest.update(pd.util.hash_array(frame.to_numpy()).tobytes())
+        return digest.hexdigest()
+
+    digest.update(repr(list(frame.columns)).encode())
+    digest.update(repr(list(frame.dtypes)).encode())
+    for position, column in enumerate(frame.columns):
+        values = frame.iloc[:, position]._values  # pylint: disable=W0212
+        memory = None if columns is None or column in columns else _memory(values)
+        if memory is None:
+            digest.update(pd.util.hash_array(np.asarray(values)).tobytes())
+        else:
+            digest.update(repr(memory).encode())
+            if keep is not None:
+                keep.append(values)
+
+    return digest.hexdigest()
+
+
+def _recorded(function, *args, **kwargs):
+    """Call a function and record its warnings.
+
+    Returns
+    -------
+    tuple
+        The result and a list of the message, category, filename and line
+        number of each warning, which can be pickled.
+
+    """
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        result = function(*args, **kwargs)
+
+    recorded = [
+        (str(warning.message), warning.category, warning.filename, warning.lineno)
+        for warning in caught
+    ]
+    return result, recorded
+
+
+def _warn_again(recorded):
+    """Emit warnings recorded by `_recorded`."""
+    for message, category, filename, lineno in recorded:
+        warnings.warn_explicit(message, category, filename, lineno)
+
+
+def _shallow_copy(result):
+    """Copy the dataframes of a result, but not their values."""
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return result.copy(deep=False)
+    if isinstance(result, dict):
+        return {key: _shallow_copy(value) for key, value in result.items()}
+
+    return result
+
+
+def memoized(columns=None, pure_only=False):
+    """Look up results of a function in the active cache.
+
+    If no cache is active, the function is called directly.
+
+    Parameters
+    ----------
+    columns : list of str, default None
+        Columns of the input dataframes, which the result depends on, see
+        `fingerprint`. By default all columns.
+    pure_only : bool, default False
+        Only cache calls of a pure `ADNI` accessor, since the method changes
+        the dataframe in place otherwise and a hit would skip that.
+
+    Returns
+    -------
+    callable
+        Decorator of a function or method, which takes dataframes or an
+        `ADNI` object.
+
+    """
+
+    def decorator(function):
+        name = function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _active or getattr(_local, "depth", 0):
+                return function(*args, **kwargs)
+            if pure_only and not getattr(args[0], "_pure", True):
+                return function(*args, **kwargs)
+
+            cache = _active[0]
+            keep = []
+
+            def key_part(arg):
+                arg = getattr(arg, "_df", arg)
+                if isinstance(arg, (pd.DataFrame, pd.Series)):
+                    return fingerprint(arg, columns=columns, keep=keep)
+                return repr(arg)
+
+            try:
+                key = (
+                    name,
+                    tuple(key_part(arg) for arg in args),
+                    tuple(sorted((key, key_part(arg)) for key, arg in kwargs.items())),
+                )
+            except TypeError:
+                return function(*args, **kwargs)
+
+            found, entry = cache.get(key)
+            if not found:
+                entry = _recorded(function, *args, **kwargs)
+                cache.put(key, entry, keep=keep)
+
+            result, recorded = entry
+            _warn_again(recorded)
+            return _shallow_copy(result)
+
+        return wrapper
+
+    return decorator
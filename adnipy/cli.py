@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+
+"""Standardize ADNI csv files into columnar files.
+
+Each file is read with `adnipy.read_csv`, gets standard column names and
+dates and is written as a .parquet or .feather file::
+
+    adnipy --jobs 4 --chunksize 100000 -o converted downloads/*.csv
+"""
+
+# Standard library imports
+import argparse
+import concurrent.futures
+import contextlib
+import functools
+import io
+import pathlib
+import sys
+import time
+
+FORMATS = ["parquet", "feather"]
+
+
+def peak_memory():
+    """Get the peak resident memory of this process in bytes.
+
+    Returns
+    -------
+    int or None
+        None, if the platform does not provide it.
+
+    """
+    try:
+        # Standard library imports
+        import resource  # pylint: disable=C0415
+    except ImportError:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _standardized(dataframe):
+    """Standardize column names and dates without printing."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        dataframe = dataframe.adni.standard_column_names()
+
+    return dataframe.adni.standard_dates()
+
+
+def _arrow_writer(path, schema, file_format):
+    """Open a writer for record batches of a schema."""
+    # Third party imports
+    import pyarrow as pa  # pylint: disable=C0415
+    import pyarrow.parquet as pq  # pylint: disable=C0415
+
+    if file_format == "parquet":
+        return pq.ParquetWriter(path, schema)
+
+    return pa.ipc.new_file(path, schema)
+
+
+def _common_dtype(dtypes):
+    """Get a dtype, which can hold the values of all dtypes."""
+    # Third party imports
+    import numpy as np  # pylint: disable=C0415
+
+    dtypes = set(dtypes)
+    if len(dtypes) == 1:
+        return dtypes.pop()
+    if all(np.issubdtype(dtype, np.number) for dtype in dtypes):
+        # columns of integers with missing values are read as floats
+        return np.dtype(np.float64)
+
+    return np.dtype(object)
+
+
+def sniff_dtypes(file, chunksize):
+    """Find dtypes, which fit the values of all chunks of a file.
+
+    pandas infers the dtypes of each chunk separately. A column may be
+    empty or hold integers in one chunk and text or decimals in another.
+    The dtypes of all chunks are widened from integers to floats and
+    from numbers to objects.
+
+    Parameters
+    ----------
+    file : str, pathlib.Path
+        The .csv file.
+    chunksize : int
+        Rows read at a time.
+
+    Returns
+    -------
+    dict
+        The dtype of each column.
+
+    """
+    from . import adnipy  # pylint: disable=C0415
+
+    dtypes = {}
+    for chunk in adnipy.read_csv(file, chunksize=chunksize):
+        for column, dtype in chunk.dtypes.items():
+            dtypes.setdefault(column, set()).add(dtype)
+
+    return {
+        column: _common_dtype(column_dtypes) for column, column_dtypes in dtypes.items()
+    }
+
+
+def _schema(table):
+    """Get the schema of the first chunk for all chunks.
+
+    Text columns, which are empty in the first chunk, are stored as strings.
+    """
+    # Third party imports
+    import pyarrow as pa  # pylint: disable=C0415
+
+    return pa.schema(
+        [
+            field.with_type(pa.string()) if pa.types.is_null(field.type) else field
+            for field in table.schema
+        ]
+    )
+
+
+def convert(file, output, file_format="parquet", chunksize=None, progress=None):
+    """Standardize one csv file and write it as a columnar file.
+
+    Parameters
+    ----------
+    file : str, pathlib.Path
+        The .csv file.
+    output : str, pathlib.Path
+        The file to write.
+    file_format : {'parquet', 'feather'}, default 'parquet'
+        Format of the output.
+    chunksize : int, default None
+        Read, standardize and write this many rows at a time, so that large
+        files do not have to fit into memory. By default the whole file.
+        The file is read twice then, first to find the dtypes of all chunks
+        with `sniff_dtypes`.
+    progress : callable, default None
+        Is called with the number of rows converted so far after each chunk.
+
+    Returns
+    -------
+    dict
+        The 'file', 'output', number of 'rows', 'seconds' and the
+        'peak_memory' of the process in bytes.
+
+    """
+    # Third party imports
+    import pyarrow as pa  # pylint: disable=C0415
+
+    from . import adnipy  # pylint: disable=C0415
+
+    start = time.perf_counter()
+    if chunksize is None:
+        chunks = [adnipy.read_csv(file)]
+    else:
+        dtypes = sniff_dtypes(file, chunksize)
+        chunks = adnipy.read_csv(file, chunksize=chunksize, dtype=dtypes)
+
+    rows = 0
+    writer = None
+    schema = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(_standardized(chunk), preserve_index=False)
+            if writer is None:
+                schema = _schema(table)
+                writer = _arrow_writer(output, schema, file_format)
+            if table.column_names != schema.names:
+                raise ValueError(f"Columns of {file} change between chunks.")
+            writer.write_table(table.cast(schema))
+            rows += table.num_rows
+            if progress is not None:
+                progress(rows)
+    except BaseException:
+        if writer is not None:
+            writer.close()
+            pathlib.Path(output).unlink(missing_ok=True)
+        raise
+
+    if writer is not None:
+        writer.close()
+
+    return {
+        "file": str(file),
+        "output": str(output),
+        "rows": rows,
+        "seconds": time.perf_counter() - start,
+        "peak_memory": peak_memory(),
+    }
+
+
+def _format_memory(n_bytes):
+    """Format bytes as megabytes."""
+    return "unknown" if n_bytes is None else f"{n_bytes / 2**20:.0f} MB"
+
+
+def _print_rows(file, rows):
+    """Print the number of rows converted so far."""
+    print(f"{file}: {rows} rows", file=sys.stderr)
+
+
+def _report(result, prefix=""):
+    """Print rows, rows per second and memory of a conversion."""
+    rate = result["rows"] / result["seconds"] if result["seconds"] else 0
+    print(
+        f"{prefix}{result['file']}: {result['rows']} rows in "
+        f"{result['seconds']:.1f} s ({rate:.0f} rows/s), "
+        f"peak memory {_format_memory(result['peak_memory'])}",
+        file=sys.stderr,
+    )
+
+
+def parse_args(argv=None):
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(prog="adnipy", description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="+", type=pathlib.Path, help=".csv files")
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        type=pathlib.Path,
+        help="directory of the output files, by default next to each input",
+    )
+    parser.add_argument("-f", "--format", choices=FORMATS, default="parquet")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of files converted in parallel processes, -1 for all CPUs",
+    )
+    parser.add_argument(
+        "-c", "--chunksize", type=int, help="rows read at a time, by default all"
+    )
+    parser.add_argument("-q", "--quiet", action="store_true", help="no progress")
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Convert the files and report the progress.
+
+    Returns
+    -------
+    int
+        The exit status.
+
+    """
+    args = parse_args(argv)
+
+    from . import parallel  # pylint: disable=C0415
+
+    if args.output_dir is not None:
+        args.output_dir.mkdir(parents=True, exist_ok=True)
+    tasks = [
+        (
+            file,
+            (args.output_dir or file.parent) / f"{file.stem}.{args.format}",
+            args.format,
+            args.chunksize,
+        )
+        for file in args.files
+    ]
+    n_jobs = min(parallel.effective_n_jobs(args.jobs), len(tasks))
+
+    start = time.perf_counter()
+    results = []
+    if n_jobs == 1:
+        for task in tasks:
+            progress = None
+            if not args.quiet and args.chunksize is not None:
+                progress = functools.partial(_print_rows, task[0])
+            results.append(convert(*task, progress=progress))
+            if not args.quiet:
+                _report(results[-1], prefix=f"[{len(results)}/{len(tasks)}] ")
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            futures = [executor.submit(convert, *task) for task in tasks]
+            for future in concurrent.futures.as_completed(futures):
+                results.append(future.result())
+                if not args.quiet:
+                    _report(results[-1], prefix=f"[{len(results)}/{len(tasks)}] ")
+
+    if not args.quiet and len(results) > 1:
+        peak_memories = [result["peak_memory"] for result in results]
+        peak_memories.append(peak_memory())
+        total = {
+            "file": "total",
+            "rows": sum(result["rows"] for result in results),
+            "seconds": time.perf_counter() - start,
+            "peak_memory": None if None in peak_memories else max(peak_memories),
+        }
+        _report(total)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+"""Measure time and memory of adnipy functions."""
+
+# Standard library imports
+import contextlib
+import functools
+import os
+import time
+
+# Third party imports
+import numpy as np
+import pandas as pd
+
+FIELDS = ["function", "seconds", "rows_in", "rows_out", "bytes_allocated", "copies"]
+
+_recorders = []
+
+
+class Recorder:
+    """Collect measurements of instrumented calls.
+
+    Parameters
+    ----------
+    callback : callable, default None
+        Is called with the record of each call as a dict.
+
+    Attributes
+    ----------
+    records : list of dict
+        One record for each call with the keys in `FIELDS`.
+
+    """
+
+    def __init__(self, callback=None):
+        """Create an empty recorder."""
+        self.callback = callback
+        self.records = []
+
+    def record(self, record):
+        """Store a record and pass it to the callback."""
+        self.records.append(record)
+        if self.callback is not None:
+            self.callback(record)
+
+    def to_frame(self):
+        """Get the records as a dataframe.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row for each call with the columns in `FIELDS`.
+
+        """
+        return pd.DataFrame(self.records, columns=FIELDS)
+
+
+global_recorder = Recorder()
+if os.environ.get("ADNIPY_INSTRUMENT", "").lower() not in ("", "0", "false"):
+    _recorders.append(global_recorder)
+
+
+@contextlib.contextmanager
+def instrument(callback=None):
+    """Record instrumented calls inside of a with statement.
+
+    Calls in all threads are recorded while the context is active.
+    Setting the environment variable ADNIPY_INSTRUMENT records all calls
+    in `global_recorder` instead.
+
+    Parameters
+    ----------
+    callback : callable, default None
+        Is called with the record of each call as a dict.
+
+    Yields
+    ------
+    Recorder
+        Contains the records of the calls.
+
+    Examples
+    --------
+    >>> with instrument() as recorder:
+    ...     _ = pd.DataFrame({"Subject ID": ["101_S_1001"]}).adni.rid()
+    >>> recorder.to_frame()[["function", "rows_in", "rows_out", "copies"]]
+       function  rows_in  rows_out  copies
+    0  ADNI.rid        1         1       1
+
+    """
+    recorder = Recorder(callback)
+    _recorders.append(recorder)
+    try:
+        yield recorder
+    finally:
+        _recorders.remove(recorder)
+
+
+def _frames(value):
+    """Get all dataframes and series of a return value."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return [value]
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, (list, tuple)):
+        return [frame for item in value for frame in _frames(item)]
+
+    return []
+
+
+def _arrays(frames):
+    """Get the numpy arrays, which hold the data of the frames."""
+    arrays = []
+    for frame in frames:
+        if isinstance(frame, pd.Series):
+            frame = frame.to_frame()
+        for position in range(frame.shape[1]):
+            array = frame.iloc[:, position].to_numpy()
+            if isinstance(array, np.ndarray):
+                arrays.append(array)
+
+    return arrays
+
+
+def instrumented(function):
+    """Record time, rows and copies of a function while instrumenting.
+
+    If no recording is active, the function is called directly.
+
+    Parameters
+    ----------
+    function : callable
+        Function or method, which takes dataframes or an `ADNI` object.
+
+    Returns
+    -------
+    callable
+        The wrapped function.
+
+    """
+    name = function.__qualname__
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not _recorders:
+            return function(*args, **kwargs)
+
+        frames_in = _frames([getattr(arg, "_df", arg) for arg in args])
+        arrays_in = _arrays(frames_in)
+
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        seconds = time.perf_counter() - start
+
+        frames_out = _frames(result)
+        copies = [
+            array
+            for array in _arrays(frames_out)
+            if not any(np.may_share_memory(array, other) for other in arrays_in)
+        ]
+        record = {
+            "function": name,
+            "seconds": seconds,
+            "rows_in": sum(len(frame) for frame in frames_in) if frames_in else None,
+            "rows_out": sum(len(frame) for frame in frames_out),
+            "bytes_allocated": sum(array.nbytes for array in copies),
+            "copies": len(copies),
+        }
+        for recorder in list(_recorders):
+            recorder.record(record)
+
+        return result
+
+    return wrapper
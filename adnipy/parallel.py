@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+
+"""Run per-subject work on shards of dataframes in parallel."""
+
+# Standard library imports
+import concurrent.futures
+import os
+
+# Third party imports
+import numpy as np
+import pandas as pd
+
+from . import cache
+from .cache import _recorded, _warn_again
+
+BACKENDS = {
+    "threads": concurrent.futures.ThreadPoolExecutor,
+    "processes": concurrent.futures.ProcessPoolExecutor,
+}
+
+
+def _key_values(dataframe, key):
+    """Get values of a column or index level."""
+    if key in dataframe.columns:
+        return dataframe[key].to_numpy()
+
+    return dataframe.index.get_level_values(key).to_numpy()
+
+
+def effective_n_jobs(n_jobs):
+    """Get the number of workers for n_jobs.
+
+    Parameters
+    ----------
+    n_jobs : int or None
+        None means 1. Negative values count back from the number of CPUs,
+        so -1 uses all CPUs.
+
+    Returns
+    -------
+    int
+        At least 1.
+
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs < 0:
+        n_jobs = (os.cpu_count() or 1) + 1 + n_jobs
+
+    return max(n_jobs, 1)
+
+
+def subject_shards(dataframe, n_shards, key="Subject ID"):
+    """Split a dataframe into shards, which do not split subjects.
+
+    Parameters
+    ----------
+    dataframe : pd.DataFrame
+        Key must be a column or index level without missing values.
+    n_shards : int
+        Maximum number of shards. Shards have about the same number of rows.
+    key : str, default 'Subject ID'
+        Identifies the subject of each row.
+
+    Returns
+    -------
+    list of pd.DataFrame
+        Shards sorted by key. Each subject is in exactly one shard.
+
+    Examples
+    --------
+    >>> subjects = pd.DataFrame({"Subject ID": ["102", "101", "102", "103"]})
+    >>> [shard["Subject ID"].tolist() for shard in subject_shards(subjects, 2)]
+    [['101', '102', '102'], ['103']]
+
+    """
+    dataframe = dataframe.sort_values(key, kind="stable")
+    values = _key_values(dataframe, key)
+    n_rows = len(values)
+    if n_rows == 0:
+        return [dataframe]
+
+    starts = np.flatnonzero(np.r_[True, values[1:] != values[:-1]])
+    targets = np.arange(1, n_shards) * n_rows / n_shards
+    bounds = starts[np.minimum(np.searchsorted(starts, targets), len(starts) - 1)]
+    bounds = np.unique(np.r_[0, bounds[bounds > 0], n_rows])
+
+    return [dataframe.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def _uncached(function, *args, record=True):
+    """Call the function of a shard without caching its result.
+
+    Warnings are recorded and returned with the result, since warnings of
+    other processes do not reach the caller. Threads do not record them,
+    because `warnings.catch_warnings` is not thread-safe, but their warnings
+    reach the caller anyway.
+    """
+    with cache.bypassed():
+        if record:
+            return _recorded(function, *args)
+        return function(*args), []
+
+
+def _merge(results):
+    """Concatenate the results of the shards in order."""
+    first = results[0]
+    if isinstance(first, dict):
+        keys = list(dict.fromkeys(key for result in results for key in result))
+        return {
+            key: pd.concat([result[key] for result in results if key in result])
+            for key in keys
+        }
+
+    return pd.concat(results)
+
+
+def map_subjects(
+    function, frames, n_jobs=1, key="Subject ID", backend="threads", args=()
+):
+    """Apply a function to shards of whole subjects in parallel.
+
+    The first dataframe is split into shards with `subject_shards`.
+    The other dataframes are split into the same ranges of subjects.
+    The results are merged in the order of the shards, so the output does not
+    depend on the number of jobs. Warnings of worker processes are emitted
+    again by the caller, once for each distinct message.
+
+    Parameters
+    ----------
+    function : callable
+        Is called with one shard of each dataframe and args.
+        It must return a dataframe, series or dict of them.
+    frames : list of pd.DataFrame
+        Dataframes with the key as column or index level.
+    n_jobs : int, default 1
+        Number of workers, see `effective_n_jobs`.
+    key : str, default 'Subject ID'
+        Identifies the subject of each row.
+    backend : {'threads', 'processes'}, default 'threads'
+        Processes need a function, which can be pickled.
+        Threads only run at the same time while pandas and numpy release the
+        global interpreter lock.
+    args : tuple, default ()
+        Further arguments of function.
+
+    Returns
+    -------
+    pd.DataFrame, pd.Series or dict
+        The concatenated results. Dicts are concatenated for each key.
+
+    """
+    n_jobs = effective_n_jobs(n_jobs)
+    first, *others = frames
+    shards = subject_shards(first, n_jobs, key=key)
+
+    others = [other.sort_values(key, kind="stable") for other in others]
+    other_values = [_key_values(other, key) for other in others]
+    tasks = []
+    for shard in shards:
+        values = _key_values(shard, key)
+        shard_frames = [shard]
+        for other, keys in zip(others, other_values):
+            if len(values) == 0:
+                shard_frames.append(other.iloc[:0])
+                continue
+            start = np.searchsorted(keys, values[0], side="left")
+            stop = np.searchsorted(keys, values[-1], side="right")
+            shard_frames.append(other.iloc[start:stop])
+        tasks.append(shard_frames)
+
+    if n_jobs == 1 or len(tasks) == 1:
+        outputs = [_uncached(function, *shard_frames, *args) for shard_frames in tasks]
+    else:
+        record = backend == "processes"
+        with BACKENDS[backend](max_workers=n_jobs) as executor:
+            futures = [
+                executor.submit(
+                    _uncached, function, *shard_frames, *args, record=record
+                )
+                for shard_frames in tasks
+            ]
+            outputs = [future.result() for future in futures]
+
+    results = [result for result, _ in outputs]
+    recorded = [warning for _, shard_warnings in outputs for warning in shard_warnings]
+    _warn_again(dict.fromkeys(recorded))
+
+    return _merge(results)
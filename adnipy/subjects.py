@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+
+"""Index ADNI tables by subject for constant-time lookups."""
+
+# Standard library imports
+import json
+import pathlib
+
+# Third party imports
+import numpy as np
+import pandas as pd  # noqa: F401 pylint: disable=W0611 (used in examples)
+
+from .adni import ADNI
+from .adnipy import read_ipc
+
+
+class SubjectIndex:
+    """Row ranges of each subject in a set of sorted ADNI tables.
+
+    Every table is sorted once by 'RID' and the `ADNI.INDEX` columns.
+    For each table an offset array is stored, in which the rows of a subject
+    with roster ID ``rid`` are ``offsets[rid]:offsets[rid + 1]``.
+    Looking up a subject is therefore independent of the table size.
+
+    Parameters
+    ----------
+    tables : dict of str to pd.DataFrame
+        Standardized dataframes, for example a collection, ADNIMERGE and
+        TAUMETA. Each needs a 'RID' or 'Subject ID' column.
+
+    Attributes
+    ----------
+    tables : dict of str to pd.DataFrame
+        The sorted tables. Rows without 'RID' are dropped.
+    offsets : dict of str to np.ndarray
+        Offsets of the subjects in the sorted tables.
+
+    See Also
+    --------
+    ADNI.rid
+
+    Examples
+    --------
+    >>> collection = pd.DataFrame(
+    ...     {
+    ...         "Subject ID": ["102_S_1002", "101_S_1001", "102_S_1002"],
+    ...         "Image ID": [100002, 100001, 200002],
+    ...     }
+    ... )
+    >>> index = SubjectIndex({"collection": collection})
+    >>> index.get(1002, "collection")
+       Subject ID  Image ID   RID
+    1  102_S_1002    100002  1002
+    2  102_S_1002    200002  1002
+
+    """
+
+    def __init__(self, tables=None):
+        """Sort the tables and compute the subject offsets."""
+        self.tables = {}
+        self.offsets = {}
+        for name, table in (tables or {}).items():
+            self.add(name, table)
+
+    def __repr__(self):
+        """Show the indexed tables and their number of rows."""
+        tables = ", ".join(
+            f"{name}: {len(table)} rows" for name, table in self.tables.items()
+        )
+        return f"SubjectIndex({tables})"
+
+    def __contains__(self, rid):
+        """Check if the subject has rows in any of the tables."""
+        return any(self.rows(name, rid) for name in self.tables)
+
+    def add(self, name, table):
+        """Sort a table by subject and add it to the index.
+
+        Parameters
+        ----------
+        name : str
+            The table can be accessed with this name.
+        table : pd.DataFrame
+            A standardized dataframe with a 'RID' or 'Subject ID' column.
+
+        """
+        if "RID" not in table.columns:
+            table = table.adni.pure.rid()
+        if "RID" not in table.columns:
+            raise KeyError(f"Table '{name}' needs a 'RID' or 'Subject ID' column.")
+
+        table = table[table["RID"].notna()]
+        keys = ["RID"] + [key for key in ADNI.INDEX if key in table.columns]
+        table = table.sort_values(keys, kind="mergesort", ignore_index=True)
+
+        rids = table["RID"].to_numpy(dtype=np.int64)
+        max_rid = rids[-1] if len(rids) else -1
+        offsets = np.searchsorted(rids, np.arange(max_rid + 2), side="left")
+
+        self.tables[name] = table
+        self.offsets[name] = offsets
+
+    def rows(self, name, rid):
+        """Get the row range of a subject in a sorted table.
+
+        Parameters
+        ----------
+        name : str
+            Name of the table.
+        rid : int
+            Roster ID of the subject.
+
+        Returns
+        -------
+        range
+            Positions of the subject's rows. Empty if the subject is missing.
+
+        """
+        offsets = self.offsets[name]
+        rid = int(rid)
+        if rid < 0 or rid + 1 >= len(offsets):
+            return range(0)
+
+        return range(int(offsets[rid]), int(offsets[rid + 1]))
+
+    def get(self, rid, name=None):
+        """Get all rows of a subject.
+
+        Parameters
+        ----------
+        rid : int
+            Roster ID of the subject.
+        name : str, default None
+            Only return rows of this table.
+
+        Returns
+        -------
+        pd.DataFrame or dict of str to pd.DataFrame
+            Rows of the subject in the table or in each table.
+
+        """
+        if name is not None:
+            rows = self.rows(name, rid)
+            return self.tables[name].iloc[rows.start : rows.stop]
+
+        return {table: self.get(rid, table) for table in self.tables}
+
+    def save(self, path):
+        """Write the index to a directory.
+
+        The offsets are saved as .npy files and the sorted tables as Arrow
+        IPC files, so that `load` can memory-map both. Requires pyarrow.
+
+        Parameters
+        ----------
+        path : str, pathlib.Path
+            Directory for the index. It will be created if necessary.
+
+        """
+        path = pathlib.Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        names = list(self.tables)
+        for number, name in enumerate(names):
+            np.save(path / f"offsets_{number}.npy", self.offsets[name])
+            self.tables[name].adni.to_ipc(path / f"table_{number}.arrow")
+
+        with open(path / "tables.json", "w", encoding="utf-8") as tables_file:
+            json.dump(names, tables_file)
+
+    @classmethod
+    def load(cls, path, mmap_mode="r"):
+        """Read an index written by `save`.
+
+        Parameters
+        ----------
+        path : str, pathlib.Path
+            Directory of the index.
+        mmap_mode : {None, 'r', 'r+', 'c'}, default 'r'
+            Memory-map the offsets instead of reading them into memory.
+            Unless it is None, the numeric and datetime columns of the tables
+            are memory-mapped as well, see `adnipy.read_ipc`.
+
+        Returns
+        -------
+        SubjectIndex
+            The index with the same tables and offsets.
+
+        """
+        path = pathlib.Path(path)
+        with open(path / "tables.json", encoding="utf-8") as tables_file:
+            names = json.load(tables_file)
+
+        index = cls()
+        for number, name in enumerate(names):
+            index.offsets[name] = np.load(
+                path / f"offsets_{number}.npy", mmap_mode=mmap_mode
+            )
+            index.tables[name] = read_ipc(
+                path / f"table_{number}.arrow", memory_map=mmap_mode is not None
+            )
+
+        return index
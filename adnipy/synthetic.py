@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+
+"""Generate synthetic ADNI data for testing and benchmarking."""
+
+# Third party imports
+import numpy as np
+import pandas as pd
+
+GROUPS = ["CN", "SMC", "EMCI", "LMCI", "MCI", "AD"]
+MODALITIES = {
+    "MRI": ["MPRAGE", "Accelerated Sagittal MPRAGE", "MT1; N3m"],
+    "PET": ["AV1451 Coreg, Avg, Std Img and Vox Siz, Uniform Resolution"],
+    "AV45": ["AV45 Coreg, Avg, Std Img and Vox Siz, Uniform Resolution"],
+    "FDG": ["Coreg, Avg, Std Img and Vox Siz, Uniform Resolution"],
+}
+MONTHS_PER_VISIT = 6
+FIRST_DATE = np.datetime64("2005-09-01")
+
+
+def _visits(n_subjects, n_visits, seed):
+    """Draw the visits of each subject.
+
+    Returns
+    -------
+    visits : pd.DataFrame
+        One row per visit with 'RID', 'Subject ID', 'Group', 'VISCODE',
+        'EXAMDATE' and 'Years_bl'.
+    subject : np.ndarray
+        Position of the subject of each visit.
+    rng : np.random.Generator
+        Random number generator for further columns.
+
+    """
+    rng = np.random.default_rng(seed)
+    rids = np.arange(1, n_subjects + 1)
+    sites = rng.integers(2, 942, size=n_subjects)
+    groups = rng.choice(GROUPS, size=n_subjects)
+    baselines = FIRST_DATE + rng.integers(0, 15 * 365, size=n_subjects).astype(
+        "timedelta64[D]"
+    )
+    visit_counts = rng.integers(1, n_visits + 1, size=n_subjects)
+
+    subject = np.repeat(np.arange(n_subjects), visit_counts)
+    starts = np.repeat(np.cumsum(visit_counts) - visit_counts, visit_counts)
+    visit = np.arange(len(subject)) - starts
+    months = visit * MONTHS_PER_VISIT
+    jitter = rng.integers(-14, 15, size=len(subject)) * (visit > 0)
+    dates = (
+        baselines[subject]
+        + (months * 30.44).astype("timedelta64[D]")
+        + jitter.astype("timedelta64[D]")
+    )
+
+    # ADNI roster IDs have four digits, more subjects get wider IDs
+    roster_ids = rids[subject]
+    subject_ids = pd.Series(sites[subject]).map("{:03d}".format) + pd.Series(
+        roster_ids
+    ).map("_S_{:04d}".format)
+    viscodes = np.where(
+        months == 0, "bl", pd.Series(months).map("m{:02d}".format).to_numpy()
+    )
+
+    visits = pd.DataFrame(
+        {
+            "RID": roster_ids,
+            "Subject ID": subject_ids,
+            "Group": groups[subject],
+            "VISCODE": viscodes,
+            "EXAMDATE": dates.astype("datetime64[ns]"),
+            "Years_bl": ((dates - baselines[subject]).astype(int) / 365.25).round(2),
+        }
+    )
+
+    return visits, subject, rng
+
+
+def make_collection(n_subjects=100, n_visits=4, modalities=("MRI", "PET"), seed=0):
+    """Generate an image collection as downloaded from the ADNI database.
+
+    Parameters
+    ----------
+    n_subjects : int, default 100
+        Number of subjects.
+    n_visits : int, default 4
+        Maximum number of visits of a subject. Each subject has between one
+        and this many visits, six months apart.
+    modalities : sequence of str, default ('MRI', 'PET')
+        Keys of `MODALITIES`. Each visit has one image per modality.
+    seed : int, default 0
+        Seed of the random number generator.
+        The same seed gives the same subjects in all generated tables.
+
+    Returns
+    -------
+    pd.DataFrame
+        Collection with the original column names, like `read_csv` returns it.
+
+    Examples
+    --------
+    >>> collection = make_collection(n_subjects=2, modalities=["MRI"])
+    >>> collection[["Subject", "Visit", "Modality", "Acq Date"]]
+          Subject Visit Modality    Acq Date
+    0  600_S_0002    bl      MRI  04/13/2006
+    1  801_S_0001    bl      MRI  04/13/2010
+
+    """
+    visits, subject, rng = _visits(n_subjects, n_visits, seed)
+    n_images = len(visits) * len(modalities)
+    visit = np.tile(np.arange(len(visits)), len(modalities))
+    modality = np.repeat(np.asarray(modalities, dtype=object), len(visits))
+
+    descriptions = np.empty(n_images, dtype=object)
+    for name in modalities:
+        is_modality = modality == name
+        descriptions[is_modality] = rng.choice(MODALITIES[name], size=is_modality.sum())
+
+    dates = visits["EXAMDATE"].to_numpy()[visit]
+    collection = pd.DataFrame(
+        {
+            "Image Data ID": 100000 + rng.permutation(n_images),
+            "Subject": visits["Subject ID"].to_numpy()[visit],
+            "Group": visits["Group"].to_numpy()[visit],
+            "Visit": visits["VISCODE"].to_numpy()[visit],
+            "Modality": modality,
+            "Description": descriptions,
+            "Type": rng.choice(["Original", "Pre-processed", "Processed"], n_images),
+            "Acq Date": dates,
+            "Format": "NiFTI",
+            "Downloaded": "1/01/2020",
+        }
+    )
+    collection = collection.sort_values(["Subject", "Acq Date"], kind="mergesort")
+    collection = collection.reset_index(drop=True)
+    collection["Acq Date"] = collection["Acq Date"].dt.strftime("%m/%d/%Y")
+
+    return collection
+
+
+def make_adnimerge(n_subjects=100, n_visits=4, seed=0):
+    """Generate clinical data like ADNIMERGE.
+
+    Parameters
+    ----------
+    n_subjects : int, default 100
+        Number of subjects.
+    n_visits : int, default 4
+        Maximum number of visits of a subject.
+    seed : int, default 0
+        Seed of the random number generator.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per visit with the original column names.
+
+    """
+    visits, subject, rng = _visits(n_subjects, n_visits, seed)
+    n_rows = len(visits)
+    years = visits["Years_bl"].to_numpy()
+    decline = rng.gamma(1.0, 0.7, size=n_subjects)[subject]
+
+    def measurement(baseline, change, spread, missing=0.1):
+        """Draw a score that changes linearly over time."""
+        values = baseline + change * decline * years + rng.normal(0, spread, n_rows)
+        values[rng.random(n_rows) < missing] = np.nan
+        return values.round(1)
+
+    adnimerge = pd.DataFrame(
+        {
+            "RID": visits["RID"],
+            "PTID": visits["Subject ID"],
+            "VISCODE": visits["VISCODE"],
+            "EXAMDATE": visits["EXAMDATE"].dt.strftime("%Y-%m-%d"),
+            "DX_bl": visits["Group"],
+            "Years_bl": visits["Years_bl"],
+            "AGE": rng.normal(73, 7, n_rows).round(1),
+            "PTGENDER": rng.choice(["Male", "Female"], n_rows),
+            "MMSE": np.clip(measurement(28, -1.2, 1.0), 0, 30),
+            "ADAS13": np.clip(measurement(15, 2.5, 3.0), 0, 85),
+            "CDRSB": np.clip(measurement(1.5, 0.9, 0.5), 0, 18),
+            "ABETA": measurement(900, -30, 150, missing=0.5).astype(object),
+            "TAU": measurement(280, 10, 60, missing=0.5).astype(object),
+            "PTAU": measurement(27, 1, 8, missing=0.5).astype(object),
+            "update_stamp": "2020-01-01 00:00:00.0",
+        }
+    )
+
+    return adnimerge
+
+
+def make_taumeta(n_subjects=100, n_visits=4, seed=0):
+    """Generate tau PET scan metadata like TAUMETA.
+
+    Parameters
+    ----------
+    n_subjects : int, default 100
+        Number of subjects.
+    n_visits : int, default 4
+        Maximum number of visits of a subject.
+    seed : int, default 0
+        Seed of the random number generator.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per visit with the original column names.
+
+    """
+    visits, _, rng = _visits(n_subjects, n_visits, seed)
+    n_rows = len(visits)
+    scandates = visits["EXAMDATE"] + pd.to_timedelta(
+        rng.integers(0, 30, n_rows), unit="D"
+    )
+
+    taumeta = pd.DataFrame(
+        {
+            "RID": visits["RID"],
+            "VISCODE": visits["VISCODE"],
+            "VISCODE2": visits["VISCODE"],
+            "USERDATE": scandates.dt.strftime("%Y-%m-%d"),
+            "USERDATE2": scandates.dt.strftime("%Y-%m-%d"),
+            "SCANDATE": scandates.dt.strftime("%Y-%m-%d"),
+            "TAUTRANDT": scandates.dt.strftime("%Y-%m-%d"),
+            "TAUTIME": rng.integers(600, 1200, n_rows),
+            "update_stamp": "2020-01-01 00:00:00.0",
+        }
+    )
+
+    return taumeta
@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+
+"""Time and peak memory of the public adnipy functions.
+
+The benchmarks follow the conventions of airspeed velocity (asv).
+Each benchmark runs on synthetic data of 10^3 to 10^7 rows.
+Set ADNIPY_BENCHMARK_MAX_ROWS to leave out the larger sizes.
+"""
+
+# pylint: disable=W0201
+
+# Standard library imports
+import contextlib
+import importlib.util
+import io
+import os
+import pathlib
+import shutil
+import tempfile
+
+from adnipy import adnipy, cli, files, subjects, synthetic
+
+MAX_ROWS = int(float(os.environ.get("ADNIPY_BENCHMARK_MAX_ROWS", 10**7)))
+ROWS = [rows for rows in (10**3, 10**4, 10**5, 10**6, 10**7) if rows <= MAX_ROWS]
+# subjects have 2.5 visits with 2 images on average
+IMAGES_PER_SUBJECT = 5
+# get_matching_images loops over the images
+MATCHING_IMAGES_MAX_ROWS = 10**4
+# verify_images needs a file for each image
+VERIFY_IMAGES_MAX_ROWS = 10**4
+CHUNKSIZE = 10**5
+CLINICAL_COLUMNS = ["MMSE", "ADAS13", "CDRSB"]
+
+
+def n_subjects(rows):
+    """Get the number of subjects for a number of rows."""
+    return max(rows // IMAGES_PER_SUBJECT, 1)
+
+
+def standardized(dataframe):
+    """Standardize column names and dates."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        dataframe = dataframe.adni.standard_column_names()
+    dataframe = dataframe.adni.standard_dates()
+
+    return dataframe
+
+
+class Benchmark:
+    """Base class with the sizes of all benchmarks."""
+
+    params = ROWS
+    param_names = ["rows"]
+    number = 1
+    timeout = 1200
+
+
+class ReadCSV(Benchmark):
+    """Read a collection from a .csv file."""
+
+    def setup(self, rows):
+        """Write a collection to a temporary file."""
+        self.directory = tempfile.mkdtemp()
+        self.file = pathlib.Path(self.directory) / "collection.csv"
+        synthetic.make_collection(n_subjects(rows)).to_csv(self.file, index=False)
+
+    def teardown(self, rows):
+        """Remove the temporary file."""
+        shutil.rmtree(self.directory)
+
+    def time_read_csv(self, rows):
+        """Time read_csv."""
+        adnipy.read_csv(self.file)
+
+    def peakmem_read_csv(self, rows):
+        """Peak memory of read_csv."""
+        adnipy.read_csv(self.file)
+
+
+def require_pyarrow():
+    """Skip a benchmark if pyarrow is not installed."""
+    if importlib.util.find_spec("pyarrow") is None:
+        raise NotImplementedError
+
+
+class Convert(Benchmark):
+    """Convert a collection from a .csv file with the adnipy command."""
+
+    def setup(self, rows):
+        """Write a collection to a temporary file."""
+        require_pyarrow()
+        self.directory = tempfile.mkdtemp()
+        self.file = pathlib.Path(self.directory) / "collection.csv"
+        self.output = pathlib.Path(self.directory) / "collection.parquet"
+        synthetic.make_collection(n_subjects(rows)).to_csv(self.file, index=False)
+
+    def teardown(self, rows):
+        """Remove the temporary files."""
+        shutil.rmtree(self.directory)
+
+    def time_convert(self, rows):
+        """Time converting in chunks."""
+        cli.convert(self.file, self.output, chunksize=CHUNKSIZE)
+
+    def peakmem_convert(self, rows):
+        """Peak memory of converting in chunks."""
+        cli.convert(self.file, self.output, chunksize=CHUNKSIZE)
+
+
+class Arrow(Benchmark):
+    """Export to and read from Arrow IPC files."""
+
+    def setup(self, rows):
+        """Write a standardized collection to a temporary IPC file."""
+        require_pyarrow()
+        self.collection = standardized(synthetic.make_collection(n_subjects(rows)))
+        self.directory = tempfile.mkdtemp()
+        self.file = pathlib.Path(self.directory) / "collection.arrow"
+        self.collection.adni.to_ipc(self.file)
+
+    def teardown(self, rows):
+        """Remove the temporary file."""
+        shutil.rmtree(self.directory)
+
+    def time_to_arrow(self, rows):
+        """Time ADNI.to_arrow."""
+        self.collection.adni.to_arrow()
+
+    def peakmem_to_arrow(self, rows):
+        """Peak memory of ADNI.to_arrow."""
+        self.collection.adni.to_arrow()
+
+    def time_read_ipc(self, rows):
+        """Time read_ipc."""
+        adnipy.read_ipc(self.file)
+
+    def peakmem_read_ipc(self, rows):
+        """Peak memory of read_ipc."""
+        adnipy.read_ipc(self.file)
+
+
+class VerifyImages(Benchmark):
+    """Check the image files of a collection."""
+
+    def setup(self, rows):
+        """Create files for half of the images."""
+        if rows > VERIFY_IMAGES_MAX_ROWS:
+            raise NotImplementedError
+        self.collection = standardized(synthetic.make_collection(n_subjects(rows)))
+        self.directory = tempfile.mkdtemp()
+        self.template = str(
+            pathlib.Path(self.directory) / "{Subject ID}" / "ADNI_I{Image ID}.nii"
+        )
+        for row in self.collection.iloc[::2].to_dict(orient="records"):
+            path = pathlib.Path(self.template.format(**row))
+            path.parent.mkdir(exist_ok=True)
+            path.write_bytes(b"nifti")
+
+    def teardown(self, rows):
+        """Remove the temporary files."""
+        shutil.rmtree(self.directory)
+
+    def time_verify_images_root(self, rows):
+        """Time verify_images below a root directory."""
+        files.verify_images(self.collection, root=self.directory)
+
+    def time_verify_images_template(self, rows):
+        """Time verify_images with a path template."""
+        files.verify_images(self.collection, template=self.template)
+
+
+class Collection(Benchmark):
+    """Accessor methods and functions on an image collection."""
+
+    def setup(self, rows):
+        """Generate a raw and a standardized collection."""
+        self.raw = synthetic.make_collection(n_subjects(rows))
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.renamed = self.raw.adni.standard_column_names()
+        self.collection = standardized(self.raw)
+        self.without_rid = self.collection.drop(columns="RID")
+        self.without_description = self.collection.drop(columns="Description")
+        timepoints = self.without_description.copy().adni.timepoints()
+        self.first = timepoints["Timepoint 1"]
+        self.second = timepoints.get("Timepoint 2", self.first)
+
+    def time_standard_column_names(self, rows):
+        """Time ADNI.standard_column_names."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.raw.adni.pure.standard_column_names()
+
+    def peakmem_standard_column_names(self, rows):
+        """Peak memory of ADNI.standard_column_names."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.raw.adni.pure.standard_column_names()
+
+    def time_standard_dates(self, rows):
+        """Time ADNI.standard_dates."""
+        self.renamed.adni.pure.standard_dates()
+
+    def peakmem_standard_dates(self, rows):
+        """Peak memory of ADNI.standard_dates."""
+        self.renamed.adni.pure.standard_dates()
+
+    def time_subject_index(self, rows):
+        """Time building a SubjectIndex."""
+        subjects.SubjectIndex({"collection": self.collection})
+
+    def peakmem_subject_index(self, rows):
+        """Peak memory of building a SubjectIndex."""
+        subjects.SubjectIndex({"collection": self.collection})
+
+    def time_rid(self, rows):
+        """Time ADNI.rid."""
+        self.without_rid.adni.pure.rid()
+
+    def peakmem_rid(self, rows):
+        """Peak memory of ADNI.rid."""
+        self.without_rid.adni.pure.rid()
+
+    def time_standard_index(self, rows):
+        """Time ADNI.standard_index."""
+        self.collection.adni.standard_index()
+
+    def peakmem_standard_index(self, rows):
+        """Peak memory of ADNI.standard_index."""
+        self.collection.adni.standard_index()
+
+    def time_drop_dynamic(self, rows):
+        """Time ADNI.drop_dynamic."""
+        self.collection.adni.drop_dynamic()
+
+    def peakmem_drop_dynamic(self, rows):
+        """Peak memory of ADNI.drop_dynamic."""
+        self.collection.adni.drop_dynamic()
+
+    def time_groups(self, rows):
+        """Time ADNI.groups."""
+        self.collection.adni.groups()
+
+    def peakmem_groups(self, rows):
+        """Peak memory of ADNI.groups."""
+        self.collection.adni.groups()
+
+    def time_longitudinal(self, rows):
+        """Time ADNI.longitudinal."""
+        self.collection.adni.longitudinal()
+
+    def peakmem_longitudinal(self, rows):
+        """Peak memory of ADNI.longitudinal."""
+        self.collection.adni.longitudinal()
+
+    def time_summary(self, rows):
+        """Time ADNI.summary."""
+        self.collection.adni.summary()
+
+    def peakmem_summary(self, rows):
+        """Peak memory of ADNI.summary."""
+        self.collection.adni.summary()
+
+    def time_one_per_timepoint(self, rows):
+        """Time ADNI.one_per_timepoint."""
+        self.collection.adni.one_per_timepoint(descriptions=["MPRAGE"])
+
+    def peakmem_one_per_timepoint(self, rows):
+        """Peak memory of ADNI.one_per_timepoint."""
+        self.collection.adni.one_per_timepoint(descriptions=["MPRAGE"])
+
+    def time_timepoints(self, rows):
+        """Time ADNI.timepoints."""
+        self.without_description.adni.pure.timepoints()
+
+    def peakmem_timepoints(self, rows):
+        """Peak memory of ADNI.timepoints."""
+        self.without_description.adni.pure.timepoints()
+
+    def time_timedelta(self, rows):
+        """Time timedelta."""
+        adnipy.timedelta(self.first, self.second)
+
+    def peakmem_timedelta(self, rows):
+        """Peak memory of timedelta."""
+        adnipy.timedelta(self.first, self.second)
+
+    def time_timedelta_matrix(self, rows):
+        """Time timedelta_matrix."""
+        adnipy.timedelta_matrix(self.collection)
+
+    def peakmem_timedelta_matrix(self, rows):
+        """Peak memory of timedelta_matrix."""
+        adnipy.timedelta_matrix(self.collection)
+
+
+class Clinical(Benchmark):
+    """Accessor methods on ADNIMERGE."""
+
+    def setup(self, rows):
+        """Generate a standardized ADNIMERGE."""
+        self.adnimerge = standardized(synthetic.make_adnimerge(n_subjects(rows)))
+
+    def time_slopes(self, rows):
+        """Time ADNI.slopes."""
+        self.adnimerge.adni.slopes(CLINICAL_COLUMNS)
+
+    def peakmem_slopes(self, rows):
+        """Peak memory of ADNI.slopes."""
+        self.adnimerge.adni.slopes(CLINICAL_COLUMNS)
+
+    def time_standard_visits(self, rows):
+        """Time ADNI.standard_visits."""
+        self.adnimerge.adni.pure.standard_visits()
+
+    def peakmem_standard_visits(self, rows):
+        """Peak memory of ADNI.standard_visits."""
+        self.adnimerge.adni.pure.standard_visits()
+
+    def time_to_tensor(self, rows):
+        """Time ADNI.to_tensor."""
+        self.adnimerge.adni.to_tensor(CLINICAL_COLUMNS)
+
+    def peakmem_to_tensor(self, rows):
+        """Peak memory of ADNI.to_tensor."""
+        self.adnimerge.adni.to_tensor(CLINICAL_COLUMNS)
+
+
+class Matching(Benchmark):
+    """Match images with clinical visits."""
+
+    def setup(self, rows):
+        """Generate a standardized collection and ADNIMERGE."""
+        collection = standardized(synthetic.make_collection(n_subjects(rows)))
+        self.pet = collection[collection["Modality"] == "PET"]
+        self.adnimerge = standardized(synthetic.make_adnimerge(n_subjects(rows)))
+
+    def time_match_visits(self, rows):
+        """Time match_visits."""
+        adnipy.match_visits(self.pet, self.adnimerge, columns=CLINICAL_COLUMNS)
+
+    def peakmem_match_visits(self, rows):
+        """Peak memory of match_visits."""
+        adnipy.match_visits(self.pet, self.adnimerge, columns=CLINICAL_COLUMNS)
+
+
+class MatchingImages(Benchmark):
+    """Match images of two modalities."""
+
+    def setup(self, rows):
+        """Generate a standardized collection and split it by modality."""
+        if rows > MATCHING_IMAGES_MAX_ROWS:
+            raise NotImplementedError
+        collection = standardized(synthetic.make_collection(n_subjects(rows)))
+        self.mri = collection[collection["Modality"] == "MRI"]
+        self.pet = collection[collection["Modality"] == "PET"]
+
+    def time_get_matching_images(self, rows):
+        """Time get_matching_images."""
+        adnipy.get_matching_images(self.pet, self.mri)
+
+    def peakmem_get_matching_images(self, rows):
+        """Peak memory of get_matching_images."""
+        adnipy.get_matching_images(self.pet, self.mri)
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+"""Report how the benchmarks scale with the number of rows.
+
+Runs every benchmark of `benchmarks.benchmarks` once per size without asv
+and estimates the exponent ``k`` in ``time ~ rows^k`` between sizes::
+
+    python -m benchmarks.scaling --max-rows 1e6
+"""
+
+# Standard library imports
+import argparse
+import inspect
+import time
+import tracemalloc
+
+# Third party imports
+import numpy as np
+import pandas as pd
+
+from . import benchmarks
+
+
+def run(benchmark, method, rows, trace_memory=False):
+    """Run a benchmark method once.
+
+    Memory is traced in a separate run, since tracing slows down the code.
+
+    Returns
+    -------
+    float or int
+        The seconds or, if trace_memory is true, the peak bytes allocated.
+
+    """
+    instance = benchmark()
+    instance.setup(rows)
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    getattr(instance, method)(rows)
+    seconds = time.perf_counter() - start
+    if trace_memory:
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    if hasattr(instance, "teardown"):
+        instance.teardown(rows)
+
+    return peak_bytes if trace_memory else seconds
+
+
+def measure(max_rows=benchmarks.MAX_ROWS, pattern=""):
+    """Measure time and peak memory of each benchmark and size.
+
+    Parameters
+    ----------
+    max_rows : int
+        Largest size to measure.
+    pattern : str, default ''
+        Only measure benchmarks containing this string.
+
+    Returns
+    -------
+    pd.DataFrame
+        'seconds' and 'peak_bytes' for each benchmark and number of rows.
+
+    """
+    results = []
+    for class_name, benchmark in inspect.getmembers(benchmarks, inspect.isclass):
+        if not issubclass(benchmark, benchmarks.Benchmark):
+            continue
+        methods = [
+            name
+            for name, _ in inspect.getmembers(benchmark, inspect.isfunction)
+            if name.startswith("time_")
+            and pattern in f"{class_name}.{name[len('time_'):]}"
+        ]
+        for rows in benchmark.params:
+            if rows > max_rows or not methods:
+                continue
+            for method in methods:
+                try:
+                    seconds = run(benchmark, method, rows)
+                    peak_bytes = run(benchmark, method, rows, trace_memory=True)
+                except NotImplementedError:
+                    continue
+
+                results.append(
+                    {
+                        "benchmark": f"{class_name}.{method[len('time_'):]}",
+                        "rows": rows,
+                        "seconds": seconds,
+                        "peak_bytes": peak_bytes,
+                    }
+                )
+
+    return pd.DataFrame(results, columns=["benchmark", "rows", "seconds", "peak_bytes"])
+
+
+def scaling(results):
+    """Estimate the scaling exponents between consecutive sizes.
+
+    Parameters
+    ----------
+    results : pd.DataFrame
+        Output of `measure`.
+
+    Returns
+    -------
+    pd.DataFrame
+        Adds 'time_exponent' and 'memory_exponent'. An exponent of 1 means
+        linear scaling, 2 means quadratic scaling.
+
+    """
+    results = results.sort_values(["benchmark", "rows"], ignore_index=True)
+    log_rows = np.log(results["rows"].astype(float))
+    for column, exponent in [("seconds", "time"), ("peak_bytes", "memory")]:
+        log_values = np.log(results[column].astype(float).clip(lower=1e-9))
+        results[f"{exponent}_exponent"] = (
+            log_values.groupby(results["benchmark"]).diff()
+            / log_rows.groupby(results["benchmark"]).diff()
+        ).round(2)
+
+    return results
+
+
+def main(argv=None):
+    """Print the scaling report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-rows", type=float, default=benchmarks.MAX_ROWS)
+    parser.add_argument("--pattern", default="", help="only run matching benchmarks")
+    args = parser.parse_args(argv)
+
+    results = scaling(measure(int(args.max_rows), args.pattern))
+    with pd.option_context("display.max_rows", None, "display.width", 120):
+        print(results.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+
+"""Configuration of pytest."""
+
+# Standard library imports
+import importlib.util
+
+# modules of optional dependencies can not be imported for doctests
+collect_ignore = []
+if importlib.util.find_spec("dask") is None:
+    collect_ignore.append("adnipy/adni_dask.py")
@@ -13,6 +13,8 @@ with open("HISTORY.rst", encoding="utf-8") as history_file:
 
 requirements = ["pandas>=0.23.0", "matplotlib>=3.0.0"]
 
+extra_requirements = {"arrow": ["pyarrow"], "dask": ["dask[dataframe]"]}
+
 setup_requirements = ["pytest-runner"]
 
 test_requirements = ["pytest"]
@@ -32,9 +34,11 @@ setup(
         "Programming Language :: Python :: 3.11",
     ],
     description="Process ADNI study data with adnipy.",
+    entry_points={"console_scripts": ["adnipy=adnipy.cli:main"]},
     python_requires=">=3.8.0",
     platforms=["any"],
     install_requires=requirements,
+    extras_require=extra_requirements,
     license="MIT license",
     long_description=readme + "\n\n" + history,
     include_package_data=True,
@@ -6,6 +6,7 @@
 
 
 # Third party imports
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -138,3 +139,171 @@ def test_timepoint_extraction_second_timepoint_latest(test_df, test_timepoints):
     test_df = test_df.drop(columns="Description")
     timepoints = test_df.adni.timepoints(second="last")
     pd.testing.assert_frame_equal(correct["Timepoint 1"], timepoints["Timepoint 1"])
+
+
+def test_slopes_match_least_squares_fit():
+    """Test grouped slopes being the same as fitting each subject."""
+    adnimerge = pd.DataFrame(
+        {
+            "RID": [1001, 1001, 1001, 1002, 1002, 1003],
+            "EXAMDATE": pd.to_datetime(
+                [
+                    "2001-01-01",
+                    "2001-07-01",
+                    "2003-01-01",
+                    "2002-01-01",
+                    "2004-01-01",
+                    "2002-01-01",
+                ]
+            ),
+            "MMSE": [29, 28, 25, 30, None, 27],
+            "ADAS13": ["10", "12", "15", "8", "9", "11"],
+        }
+    )
+    slopes = adnimerge.adni.slopes(["MMSE", "ADAS13"])
+    years = np.array([0, 181, 730]) / 365.25
+    slope, intercept = np.polyfit(years, [10, 12, 15], deg=1)
+    assert np.isclose(slopes.loc[1001, ("ADAS13", "slope")], slope)
+    assert np.isclose(slopes.loc[1001, ("ADAS13", "intercept")], intercept)
+    assert slopes.loc[1002, ("MMSE", "n")] == 1
+    assert np.isnan(slopes.loc[1002, ("MMSE", "slope")])
+    assert slopes.loc[1002, ("ADAS13", "n")] == 2
+    assert np.isnan(slopes.loc[1003, ("ADAS13", "slope")])
+
+
+def test_tensor_export_to_memory_mapped_file(test_df, tmp_path):
+    """Test exporting subjects x visits x features to a .npy file."""
+    path = tmp_path / "tensor.npy"
+    values, mask, rids, viscodes = test_df.adni.to_tensor(
+        ["Image ID", "RID"], path=path
+    )
+    assert values.shape == (4, 2, 2)
+    assert rids.tolist() == [1001, 1002, 1003, 1004]
+    assert viscodes.tolist() == ["m12", "m24"]
+    assert mask.tolist() == [[True, True], [True, False], [True, False], [True, False]]
+    assert values[1, 0, 0] == 200002
+    assert np.isnan(values[1, 1]).all()
+    np.testing.assert_array_equal(values, np.load(path))
+
+
+def test_standard_dates_have_datetime_dtype(test_df):
+    """Test converting date columns to datetime."""
+    dates = test_df.adni.standard_dates()
+    assert pd.api.types.is_datetime64_any_dtype(dates["Acq Date"])
+
+
+@pytest.mark.parametrize("copy_on_write", [False, True])
+def test_pure_mode_does_not_change_dataframe(test_df, copy_on_write):
+    """Test methods in pure mode leaving the dataframe unchanged."""
+    with pd.option_context("mode.copy_on_write", copy_on_write):
+        original = test_df.copy()
+        test_df = test_df.drop(columns="RID")
+        without_rid = test_df.copy()
+        standardized = test_df.adni.pure.standard_column_names()
+        standardized = standardized.adni.pure.standard_dates()
+        test_df.adni.pure.rid()
+        test_df.drop(columns="Description").adni.pure.timepoints()
+        pd.testing.assert_frame_equal(without_rid, test_df)
+        assert "RID" in standardized.columns
+        assert pd.api.types.is_datetime64_any_dtype(standardized["SCANDATE"])
+        pd.testing.assert_frame_equal(original, test_df.adni.pure.rid())
+
+
+def test_pure_mode_shares_unchanged_columns(test_df):
+    """Test results in pure mode not copying unchanged columns."""
+    dates = test_df.adni.pure.standard_dates()
+    assert np.shares_memory(
+        dates["Image ID"].to_numpy(), test_df["Image ID"].to_numpy()
+    )
+    assert not np.shares_memory(
+        dates["Acq Date"].to_numpy(), test_df["Acq Date"].to_numpy()
+    )
+
+
+def test_one_image_per_timepoint(test_df):
+    """Test selecting one image per visit with priority rules."""
+    preferred = test_df.adni.one_per_timepoint(descriptions=["Average"])
+    pd.testing.assert_frame_equal(test_df.drop(index=[3]), preferred)
+    highest_image_id = test_df.adni.one_per_timepoint()
+    pd.testing.assert_frame_equal(test_df.drop(index=[2]), highest_image_id)
+
+
+def test_one_image_per_timepoint_with_rules(test_df):
+    """Test selecting images by an ordered list of rules."""
+    lowest_image_id = test_df.adni.one_per_timepoint(rules=[("Image ID", True)])
+    pd.testing.assert_frame_equal(test_df.drop(index=[3]), lowest_image_id)
+    test_df["Type"] = ["Original", "Original", "Processed", "Original", "", ""]
+    original = test_df.adni.one_per_timepoint(
+        rules=[("Type", ["Original"]), ("Image ID", False)]
+    )
+    pd.testing.assert_frame_equal(test_df.drop(index=[2]), original)
+    processed = test_df.adni.one_per_timepoint(
+        rules=[("Missing", True), ("Type", ["Processed"])]
+    )
+    pd.testing.assert_frame_equal(test_df.drop(index=[3]), processed)
+
+
+def test_one_image_per_date_window(test_df):
+    """Test selecting one image per window and latest processing step."""
+    test_df = test_df.rename(columns={"Acq Date": "SCANDATE"})
+    test_df["SCANDATE"] = pd.to_datetime(test_df["SCANDATE"])
+    test_df["Type"] = ["Original", "Original", "Processed", "Original", "", ""]
+    selected = test_df.adni.one_per_timepoint(window="300D")
+    assert selected["Image ID"].tolist() == [100001, 200001, 100002, 100003, 100004]
+    selected = test_df.adni.one_per_timepoint(window="400D")
+    assert selected["Image ID"].tolist() == [200001, 100002, 100003, 100004]
+
+
+def test_ipc_round_trip_shares_memory(test_df, tmp_path):
+    """Test numeric and datetime columns being memory-mapped on reload."""
+    pa = pytest.importorskip("pyarrow")
+    from adnipy import adnipy  # pylint: disable=C0415
+
+    dataframe = test_df.adni.standard_dates()
+    batch = dataframe.adni.to_arrow(columns=["RID", "Acq Date"])
+    assert np.shares_memory(batch.column(0).to_numpy(), dataframe["RID"].to_numpy())
+
+    path = tmp_path / "collection.arrow"
+    dataframe.adni.to_ipc(path)
+    allocated = pa.total_allocated_bytes()
+    reloaded = adnipy.read_ipc(path, columns=["RID", "Acq Date"])
+    assert pa.total_allocated_bytes() == allocated
+    pd.testing.assert_frame_equal(reloaded, dataframe[["RID", "Acq Date"]])
+    pd.testing.assert_frame_equal(adnipy.read_ipc(path, memory_map=False), dataframe)
+
+
+def test_standard_visits_sort_by_month(test_df):
+    """Test visit codes being ordered by months since baseline."""
+    test_df["VISCODE"] = ["m102", "m12", "bl", "y1", "sc", "nv"]
+    visits = test_df.adni.pure.standard_visits()
+    assert visits["VISMONTH"].tolist() == [102, 12, 0, 12, 0, pd.NA]
+    assert visits.sort_values("VISCODE")["VISCODE"].tolist() == [
+        "sc",
+        "bl",
+        "m12",
+        "y1",
+        "m102",
+        "nv",
+    ]
+    assert test_df["VISCODE"].dtype == object
+
+
+@pytest.mark.parametrize("dtype", [object, "string", "string[pyarrow]"])
+def test_to_tensor_orders_visits_by_month(dtype):
+    """Test 'm102' coming after 'm12' in the tensor."""
+    if dtype == "string[pyarrow]":
+        pytest.importorskip("pyarrow")
+    adnimerge = pd.DataFrame(
+        {"RID": [1001, 1001, 1001], "VISCODE": ["m102", "bl", "m12"], "MMSE": [1, 2, 3]}
+    )
+    adnimerge["VISCODE"] = adnimerge["VISCODE"].astype(dtype)
+    values, _, _, viscodes = adnimerge.adni.to_tensor(["MMSE"])
+    assert viscodes.tolist() == ["bl", "m12", "m102"]
+    assert values[0, :, 0].tolist() == [2, 3, 1]
+
+
+def test_to_tensor_needs_floating_dtype():
+    """Test integer dtypes, which can not hold missing visits."""
+    adnimerge = pd.DataFrame({"RID": [1001], "VISCODE": ["bl"], "MMSE": [29]})
+    with pytest.raises(ValueError):
+        adnimerge.adni.to_tensor(["MMSE"], dtype=np.int32)
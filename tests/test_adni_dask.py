@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the dask dataframe `adni` extension."""
+
+# pylint: disable=W0621
+
+# Standard library imports
+import contextlib
+import io
+
+# Third party imports
+import pandas as pd
+import pytest
+
+from adnipy import adnipy
+
+dask = pytest.importorskip("dask")
+dd = pytest.importorskip("dask.dataframe")
+adni_dask = pytest.importorskip("adnipy.adni_dask")
+
+
+@pytest.fixture(autouse=True)
+def object_strings():
+    """Keep strings as objects like pandas does."""
+    with dask.config.set({"dataframe.convert-string": False}):
+        yield
+
+
+@pytest.fixture
+def test_df():
+    """Provide sample dataframe for standardized testing."""
+    columns = ["Subject", "Description", "Group", "VISCODE2", "Image", "Acq Date"]
+    subjects = [
+        ["101_S_1001", "Average", "MCI", "m12", 100001, "1/01/2001"],
+        ["101_S_1001", "Average", "MCI", "m24", 200001, "1/01/2002"],
+        ["102_S_1002", "Average", "AD", "m12", 100002, "2/02/2002"],
+        ["102_S_1002", "Dynamic", "AD", "m12", 200002, "2/02/2002"],
+        ["103_S_1003", "Average", "LMCI", "m12", 100003, "3/03/2003"],
+        ["104_S_1004", "Average", "EMCI", "m12", 100004, "4/04/2004"],
+    ]
+
+    dataframe = pd.DataFrame(subjects, columns=columns)
+
+    return dataframe
+
+
+def standardized(dataframe):
+    """Standardize column names and dates of a pandas or dask dataframe."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        dataframe = dataframe.adni.standard_column_names()
+    return dataframe.adni.standard_dates()
+
+
+def test_standardizing_like_pandas(test_df):
+    """Test standardizing partitions giving the pandas result."""
+    correct = standardized(test_df.copy())
+    dask_df = standardized(dd.from_pandas(test_df, npartitions=3)).compute()
+    pd.testing.assert_frame_equal(correct, dask_df, check_dtype=False)
+    assert "RID" not in test_df.columns
+
+
+def test_rid_dtype_of_all_partitions(test_df):
+    """Test partitions with and without missing subjects having one dtype."""
+    test_df = standardized(test_df).drop(columns="RID")
+    test_df.loc[test_df.index[-1], "Subject ID"] = None
+    dask_df = dd.from_pandas(test_df, npartitions=3).adni.rid()
+    partitions = [partition.compute() for partition in dask_df.partitions]
+    assert dask_df["RID"].dtype == "float64"
+    assert all(partition["RID"].dtype == "float64" for partition in partitions)
+    assert dask_df.compute()["RID"].tolist()[:-1] == [1001, 1001, 1002, 1002, 1003]
+
+
+def test_drop_dynamic_and_longitudinal(test_df):
+    """Test filtering partitions and subjects across partitions."""
+    dask_df = standardized(dd.from_pandas(test_df, npartitions=3))
+    no_dynamic = dask_df.adni.drop_dynamic().compute()
+    assert 200002 not in no_dynamic["Image ID"].tolist()
+    longitudinal = dask_df.adni.longitudinal().compute()
+    assert sorted(longitudinal["Image ID"]) == [100001, 100002, 200001, 200002]
+
+
+def test_get_matching_images_like_pandas(test_df):
+    """Test matching images of shuffled partitions."""
+    collection = standardized(test_df)
+    left = collection[collection["Description"] == "Average"]
+    right = collection[collection["Description"] == "Dynamic"]
+    right = pd.concat([right, left.iloc[[0]].assign(**{"Image ID": 300001})])
+    with pytest.warns(UserWarning):
+        correct = adnipy.get_matching_images(left, right[adni_dask.MATCHING_COLUMNS])
+    with pytest.warns(UserWarning):
+        matches = adni_dask.get_matching_images(
+            dd.from_pandas(left, npartitions=2),
+            dd.from_pandas(right, npartitions=3),
+        ).compute()
+    matches = matches.set_index(["Subject ID", "SCANDATE"]).sort_index()
+    assert "Group" in matches.columns
+    pd.testing.assert_frame_equal(correct, matches[correct.columns], check_dtype=False)
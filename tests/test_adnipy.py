@@ -187,3 +187,166 @@ def test_find_matching_images_with_missing_match():
     with pytest.warns(UserWarning):
         matches = adnipy.get_matching_images(left, right)
     pd.testing.assert_frame_equal(correct, matches)
+
+
+@pytest.fixture
+def test_adnimerge():
+    """Provide visits of ADNIMERGE for the subjects in test_df."""
+    adnimerge = pd.DataFrame(
+        {
+            "RID": [1001, 1001, 1002, 1004],
+            "VISCODE": ["bl", "m12", "bl", "bl"],
+            "EXAMDATE": pd.to_datetime(
+                ["12/01/2000", "12/01/2001", "1/01/2002", "1/01/2003"]
+            ),
+            "MMSE": [29.0, 27.0, 24.0, 28.0],
+        }
+    )
+    return adnimerge
+
+
+def test_match_visits_nearest(test_df, test_adnimerge):
+    """Test matching images to the closest visit of the same subject."""
+    images = test_df.rename(columns={"Acq Date": "SCANDATE"})
+    images["SCANDATE"] = pd.to_datetime(images["SCANDATE"])
+    matches = adnipy.match_visits(images, test_adnimerge, columns=["MMSE"])
+    pd.testing.assert_index_equal(images.index, matches.index)
+    assert matches["MMSE"].tolist()[:4] == [29.0, 27.0, 24.0, 24.0]
+    assert matches["MMSE"].iloc[4:].isna().tolist() == [True, False]
+
+
+def test_match_visits_tolerance_and_direction(test_df, test_adnimerge):
+    """Test not matching visits outside of the tolerance or direction."""
+    images = test_df.rename(columns={"Acq Date": "SCANDATE"})
+    images["SCANDATE"] = pd.to_datetime(images["SCANDATE"])
+    matches = adnipy.match_visits(
+        images, test_adnimerge, tolerance="60D", direction="backward"
+    )
+    assert matches["VISCODE_r"].tolist()[:4] == ["bl", "m12", "bl", "bl"]
+    assert matches["MMSE"].iloc[4:].isna().all()
+
+
+def test_match_visits_suffixes_join_keys(test_df, test_adnimerge):
+    """Test an 'EXAMDATE' of the images not being duplicated."""
+    images = test_df.rename(columns={"Acq Date": "SCANDATE"})
+    images["SCANDATE"] = pd.to_datetime(images["SCANDATE"])
+    images["EXAMDATE"] = images["SCANDATE"]
+    matches = adnipy.match_visits(
+        images, test_adnimerge, columns=["RID", "EXAMDATE", "MMSE"]
+    )
+    assert not matches.columns.duplicated().any()
+    assert "EXAMDATE_r" in matches.columns
+    assert "RID_r" not in matches.columns
+    pd.testing.assert_series_equal(matches["EXAMDATE"], images["EXAMDATE"])
+
+
+def test_match_visits_mixed_units(test_df, test_adnimerge):
+    """Test dates with different units, like dates read from Arrow files."""
+    images = test_df.rename(columns={"Acq Date": "SCANDATE"})
+    images["SCANDATE"] = pd.to_datetime(images["SCANDATE"]).astype("datetime64[s]")
+    adnimerge = test_adnimerge.astype({"EXAMDATE": "datetime64[ms]"})
+    matches = adnipy.match_visits(images, adnimerge, columns=["MMSE"])
+    assert matches["MMSE"].tolist()[:4] == [29.0, 27.0, 24.0, 24.0]
+
+
+def test_timedelta_matrix_long_format(test_df):
+    """Test timedeltas between all timepoints of each subject."""
+    scans = test_df.rename(columns={"Acq Date": "SCANDATE"})
+    scans["SCANDATE"] = pd.to_datetime(scans["SCANDATE"])
+    scans = scans.iloc[::-1]
+    correct = pd.DataFrame(
+        {
+            "Subject ID": ["101_S_1001", "102_S_1002"],
+            "From": [1, 1],
+            "To": [2, 2],
+            "Timedelta": pd.to_timedelta([365, 0], unit="D"),
+        }
+    )
+    timedeltas = adnipy.timedelta_matrix(scans)
+    pd.testing.assert_frame_equal(correct, timedeltas, check_dtype=False)
+
+
+def test_timedelta_matrix_array(test_df):
+    """Test array of timedeltas with subjects x timepoints x timepoints."""
+    scans = test_df.rename(columns={"Acq Date": "SCANDATE"})
+    scans["SCANDATE"] = pd.to_datetime(scans["SCANDATE"])
+    scans = scans.set_index(["Subject ID", "SCANDATE"])
+    subjects, deltas = adnipy.timedelta_matrix(scans, as_array=True)
+    assert subjects.tolist() == sorted(test_df["Subject ID"].unique())
+    assert deltas.shape == (4, 2, 2)
+    assert deltas[0, 0, 1] == np.timedelta64(365, "D")
+    assert deltas[0, 1, 0] == np.timedelta64(-365, "D")
+    assert np.isnat(deltas[2, 0, 1])
+
+
+def test_timedelta_matrix_pairs_like_array():
+    """Test the long format agreeing with the array for uneven subjects."""
+    rng = np.random.default_rng(0)
+    subject_ids = np.repeat(["101_S_1001", "102_S_1002", "103_S_1003"], [1, 40, 3])
+    scans = pd.DataFrame(
+        {
+            "Subject ID": subject_ids,
+            "SCANDATE": pd.Timestamp("2010-01-01")
+            + pd.to_timedelta(rng.integers(0, 3000, len(subject_ids)), unit="D"),
+        }
+    )
+    timedeltas = adnipy.timedelta_matrix(scans)
+    subjects, deltas = adnipy.timedelta_matrix(scans, as_array=True)
+    assert len(timedeltas) == 40 * 39 // 2 + 3
+    position = subjects.get_indexer(timedeltas["Subject ID"])
+    expected = deltas[position, timedeltas["From"] - 1, timedeltas["To"] - 1]
+    assert (timedeltas["Timedelta"].to_numpy() == expected).all()
+    assert (timedeltas["From"] < timedeltas["To"]).all()
+
+
+def test_summarize_chunks_like_whole_collection():
+    """Test merging subjects, which are split across chunks."""
+    # Standard library imports
+    import contextlib  # pylint: disable=C0415
+
+    from adnipy import synthetic  # pylint: disable=C0415
+
+    collection = synthetic.make_collection(n_subjects=30, seed=1)
+    with contextlib.redirect_stdout(io.StringIO()):
+        collection = collection.adni.standard_column_names()
+    collection = collection.adni.standard_dates()
+    collection["COLPROT"] = np.where(collection["RID"] % 2, "ADNI2", "ADNI3")
+
+    whole = collection.adni.summary()
+    chunks = [
+        collection.iloc[start : start + 7] for start in range(0, len(collection), 7)
+    ]
+    chunked = adnipy.summarize(chunk.adni.subject_summary() for chunk in chunks)
+    pd.testing.assert_frame_equal(chunked, whole)
+
+    assert list(whole.index.names) == ["SITE", "Group", "COLPROT"]
+    assert whole["subjects"].sum() == collection["Subject ID"].nunique()
+    assert whole["scans"].sum() == len(collection)
+    longitudinal = collection.adni.longitudinal()
+    assert whole["longitudinal"].sum() == longitudinal["RID"].nunique()
+
+
+def test_summary_by_other_columns():
+    """Test grouping by columns, which the subject summaries keep."""
+    # Standard library imports
+    import contextlib  # pylint: disable=C0415
+
+    from adnipy import synthetic  # pylint: disable=C0415
+
+    collection = synthetic.make_collection(n_subjects=30, seed=1)
+    with contextlib.redirect_stdout(io.StringIO()):
+        collection = collection.adni.standard_column_names()
+    collection = collection.adni.standard_dates()
+
+    by_modality = collection.adni.summary(by=["Modality"])
+    counts = collection.groupby("Modality")
+    pd.testing.assert_series_equal(
+        by_modality["subjects"], counts["Subject ID"].nunique(), check_names=False
+    )
+    pd.testing.assert_series_equal(
+        by_modality["scans"], counts.size(), check_names=False
+    )
+
+    summaries = collection.adni.subject_summary()
+    with pytest.raises(ValueError, match="Modality"):
+        adnipy.summarize(summaries, by=["SITE", "Modality"])
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for caching results."""
+
+# pylint: disable=W0621
+
+# Standard library imports
+import contextlib
+import io
+import warnings
+
+# Third party imports
+import pandas as pd
+import pytest
+
+from adnipy import adnipy, cache, synthetic
+
+
+@pytest.fixture
+def collection():
+    """Provide a standardized synthetic collection without descriptions."""
+    collection = synthetic.make_collection(n_subjects=10)
+    with contextlib.redirect_stdout(io.StringIO()):
+        collection = collection.adni.standard_column_names()
+    collection = collection.adni.standard_dates()
+    return collection.drop(columns="Description")
+
+
+def test_no_cache_by_default(collection):
+    """Test results not being cached without an active cache."""
+    assert not cache._active  # pylint: disable=W0212
+    assert collection.adni.groups() is not collection.adni.groups()
+
+
+def test_cached_results_equal_computed(collection):
+    """Test hits giving the same results as computing."""
+    expected = collection.adni.pure.timepoints()
+    with cache.cached() as result_cache:
+        first = collection.adni.pure.timepoints()
+        second = collection.adni.pure.timepoints(second="first")
+        third = collection.adni.pure.timepoints(second="last")
+
+    assert result_cache.stats()["hits"] == 0
+    assert result_cache.misses == 3
+    with cache.cached() as result_cache:
+        for _ in range(3):
+            result = collection.adni.pure.timepoints()
+    assert result_cache.stats() == {
+        "hits": 2,
+        "misses": 1,
+        "hit_rate": 2 / 3,
+        "entries": 1,
+        "bytes": result_cache.nbytes,
+    }
+    for name, timepoint in expected.items():
+        pd.testing.assert_frame_equal(result[name], timepoint)
+        pd.testing.assert_frame_equal(first[name], timepoint)
+        pd.testing.assert_frame_equal(second[name], timepoint)
+    assert len(third) == 2
+
+
+def test_changed_frame_misses(collection):
+    """Test a changed value giving a new fingerprint."""
+    mri = collection[collection["Modality"] == "MRI"]
+    pet = collection[collection["Modality"] == "PET"]
+    with cache.cached() as result_cache, warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        adnipy.get_matching_images(pet, mri)
+        adnipy.get_matching_images(pet, mri)
+        changed = pet.copy()
+        changed.iloc[0, changed.columns.get_loc("Image ID")] += 1
+        adnipy.get_matching_images(changed, mri)
+    assert (result_cache.hits, result_cache.misses) == (1, 2)
+
+
+def test_lru_bounds(collection):
+    """Test evicting the least recently used results."""
+    result_cache = cache.ResultCache(max_entries=2)
+    frames = [collection.iloc[:n] for n in (1, 2, 3)]
+    for frame in frames:
+        result_cache.put(cache.fingerprint(frame), frame)
+    assert len(result_cache) == 2
+    assert not result_cache.get(cache.fingerprint(frames[0]))[0]
+    assert result_cache.get(cache.fingerprint(frames[2]))[0]
+
+    result_cache = cache.ResultCache(max_bytes=collection.memory_usage().sum())
+    result_cache.put("small", collection.iloc[:1])
+    result_cache.put("large", collection)
+    assert len(result_cache) == 1
+    assert result_cache.get("large")[0]
+
+
+def test_non_pure_timepoints_are_not_cached(collection):
+    """Test in-place changes of timepoints not depending on the cache."""
+    first = collection.copy()
+    second = collection.copy()
+    with cache.cached() as result_cache:
+        first.adni.timepoints()
+        second.adni.timepoints()
+    assert list(first.index.names) == list(second.index.names)
+    assert list(second.index.names) == ["Subject ID", "Image ID"]
+    assert len(result_cache) == 0
+
+
+def test_fingerprint_of_relevant_columns(collection):
+    """Test other columns being identified by their memory."""
+    keep = []
+    key = cache.fingerprint(collection, columns=["Group"], keep=keep)
+    assert keep
+    collection["Modality"] = "MRI"
+    assert cache.fingerprint(collection, columns=["Group"]) != key
+    assert cache.fingerprint(collection) == cache.fingerprint(collection.copy())
+
+
+def test_in_place_changes_miss(collection):
+    """Test values changed in place in any column giving a new fingerprint."""
+    mri = collection[collection["Modality"] == "MRI"].reset_index(drop=True)
+    pet = collection[collection["Modality"] == "PET"].reset_index(drop=True)
+    with cache.cached() as result_cache, warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        groups = collection.adni.groups(grouped_mci=False)
+        collection.loc[0, "Visit"] = 99
+        changed_groups = collection.adni.groups(grouped_mci=False)
+        pet.adni.pure.timepoints()
+        pet.loc[0, "Modality"] = "changed"
+        changed_timepoints = pet.adni.pure.timepoints()
+        adnipy.get_matching_images(pet, mri)
+        pet.loc[0, "Group"] = "changed"
+        matched = adnipy.get_matching_images(pet, mri)
+
+    assert (result_cache.hits, result_cache.misses) == (0, 6)
+    group = collection.loc[0, "Group"]
+    assert groups[group].loc[0, "Visit"] != 99
+    assert changed_groups[group].loc[0, "Visit"] == 99
+    modalities = pd.concat(changed_timepoints.values())["Modality"]
+    assert "changed" in modalities.tolist()
+    assert "changed" in matched["Group"].tolist()
+
+
+def test_shards_are_not_cached(collection):
+    """Test caching only the merged result of parallel calls."""
+    mri = collection[collection["Modality"] == "MRI"]
+    pet = collection[collection["Modality"] == "PET"]
+    with cache.cached() as result_cache, warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        adnipy.get_matching_images(pet, mri, n_jobs=3)
+    assert len(result_cache) == 1
+
+
+def test_hits_warn_again(collection):
+    """Test hits emitting the warnings of the call, which was cached."""
+    mri = collection[collection["Modality"] == "MRI"]
+    pet = collection[collection["Modality"] == "PET"]
+    mri = mri[mri["Subject ID"] != pet["Subject ID"].iloc[0]]
+    with cache.cached() as result_cache:
+        for _ in range(2):
+            with pytest.warns(UserWarning, match="Could not find matching images"):
+                adnipy.get_matching_images(pet, mri)
+    assert (result_cache.hits, result_cache.misses) == (1, 1)
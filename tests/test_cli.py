@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the adnipy command line interface."""
+
+# pylint: disable=W0621
+
+# Third party imports
+import pandas as pd
+import pytest
+
+from adnipy import cli, synthetic
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def files(tmp_path):
+    """Provide two collection files."""
+    paths = []
+    for seed in range(2):
+        path = tmp_path / f"collection_{seed}.csv"
+        synthetic.make_collection(n_subjects=20, seed=seed).to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("file_format", cli.FORMATS)
+def test_chunks_give_whole_file(files, tmp_path, file_format):
+    """Test converting in chunks giving the same file."""
+    read = pd.read_parquet if file_format == "parquet" else pd.read_feather
+    whole = tmp_path / "whole"
+    chunked = tmp_path / "chunked"
+    args = ["--quiet", "--format", file_format, files[0]]
+    assert cli.main(["-o", str(whole), *map(str, args)]) == 0
+    assert cli.main(["-o", str(chunked), "--chunksize", "7", *map(str, args)]) == 0
+
+    expected = read(whole / f"collection_0.{file_format}")
+    pd.testing.assert_frame_equal(
+        read(chunked / f"collection_0.{file_format}"), expected
+    )
+    assert "SCANDATE" in expected.columns
+    assert pd.api.types.is_datetime64_any_dtype(expected["SCANDATE"])
+
+
+def test_jobs_and_progress(files, tmp_path, capsys):
+    """Test converting files in parallel with a progress report."""
+    output_dir = tmp_path / "converted"
+    assert cli.main(["--jobs", "2", "-o", str(output_dir), *map(str, files)]) == 0
+
+    report = capsys.readouterr().err
+    assert "rows/s" in report
+    assert "peak memory" in report
+    assert report.splitlines()[-1].startswith("total: ")
+    for file in files:
+        converted = pd.read_parquet(output_dir / f"{file.stem}.parquet")
+        assert len(converted) == len(pd.read_csv(file))
+
+
+@pytest.mark.parametrize("file_format", cli.FORMATS)
+def test_chunks_with_changing_dtypes(tmp_path, file_format):
+    """Test columns, which are empty or integers in the first chunk."""
+    read = pd.read_parquet if file_format == "parquet" else pd.read_feather
+    path = tmp_path / "adnimerge.csv"
+    path.write_text(
+        "PTID,NOTE,SCORE,EXAMDATE\n"
+        "101_S_1001,,1,\n"
+        "101_S_1001,,2,\n"
+        "102_S_1002,y,2.5,2010-01-01\n"
+        "102_S_1002,,,2011-01-01\n"
+    )
+    whole = tmp_path / "whole"
+    chunked = tmp_path / "chunked"
+    args = ["--quiet", "--format", file_format, str(path)]
+    assert cli.main(["-o", str(whole), *args]) == 0
+    assert cli.main(["-o", str(chunked), "--chunksize", "2", *args]) == 0
+
+    expected = read(whole / f"adnimerge.{file_format}")
+    pd.testing.assert_frame_equal(read(chunked / f"adnimerge.{file_format}"), expected)
+    assert expected["NOTE"].tolist()[2] == "y"
+    assert expected["SCORE"].tolist()[2] == 2.5
+
+
+def test_failed_conversion_removes_output(files, tmp_path):
+    """Test not leaving a partial file behind."""
+
+    def fail(rows):
+        raise RuntimeError("interrupted")
+
+    output = tmp_path / "collection_0.parquet"
+    with pytest.raises(RuntimeError):
+        cli.convert(files[0], output, chunksize=7, progress=fail)
+    assert not output.exists()
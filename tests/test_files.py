@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for verifying image files."""
+
+# pylint: disable=W0621
+
+# Third party imports
+import pandas as pd
+import pytest
+
+from adnipy import files
+
+
+@pytest.fixture
+def collection():
+    """Provide a collection with a present, an empty and a missing image."""
+    return pd.DataFrame(
+        {
+            "Subject ID": ["002_S_0001", "002_S_0001", "003_S_0002"],
+            "Image ID": [1, 2, 3],
+        }
+    )
+
+
+@pytest.fixture
+def root(tmp_path):
+    """Provide a directory tree with the present and the empty image."""
+    subject = tmp_path / "002_S_0001"
+    subject.mkdir()
+    (subject / "ADNI_002_S_0001_I1.nii").write_bytes(b"nifti")
+    (subject / "ADNI_002_S_0001_I2.nii").write_bytes(b"")
+    (tmp_path / "notes.txt").write_text("not an image")
+    return tmp_path
+
+
+def test_verify_images_root(collection, root):
+    """Test finding images below a root directory."""
+    verified = files.verify_images(collection, root=root, max_workers=2)
+    assert verified["status"].tolist() == ["present", "empty", "missing"]
+    assert verified["size"].tolist() == [5, 0, pd.NA]
+    assert verified["path"].iloc[0] == str(root / "002_S_0001/ADNI_002_S_0001_I1.nii")
+    assert pd.isna(verified["path"].iloc[2])
+    assert verified.attrs["throughput"]["files"] == 2
+
+
+def test_verify_images_template(collection, root):
+    """Test checking images at paths from a template."""
+    template = str(root / "{Subject ID}" / "ADNI_{Subject ID}_I{Image ID}.nii")
+    verified = files.verify_images(collection, template=template, min_size=0)
+    assert verified["status"].tolist() == ["present", "present", "missing"]
+    assert verified["path"].iloc[2].endswith("ADNI_003_S_0002_I3.nii")
+    assert verified.attrs["throughput"]["files"] == 3
+
+
+def test_verify_images_needs_root_or_template(collection):
+    """Test passing neither root nor template."""
+    with pytest.raises(ValueError):
+        files.verify_images(collection)
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for instrumenting adnipy functions."""
+
+# pylint: disable=W0621
+
+# Standard library imports
+import io
+import os
+import subprocess
+import sys
+
+# Third party imports
+import pandas as pd
+import pytest
+
+from adnipy import adnipy, instrumentation
+
+
+@pytest.fixture
+def test_file():
+    """Provide a small collection file."""
+    file = io.StringIO(
+        "Subject,Image Data ID,Acq Date\n"
+        "101_S_1001,100001,1/01/2001\n"
+        "102_S_1002,100002,2/02/2002\n"
+    )
+    return file
+
+
+def test_recording_calls(test_file):
+    """Test recording time, rows and copies of each call."""
+    with instrumentation.instrument() as recorder:
+        collection = adnipy.read_csv(test_file)
+        collection.adni.standard_dates()
+    records = recorder.to_frame()
+    assert records["function"].tolist() == ["read_csv", "ADNI.standard_dates"]
+    assert pd.isna(records.loc[0, "rows_in"])
+    assert records["rows_out"].tolist() == [2, 2]
+    assert records.loc[0, "copies"] == 3
+    assert (records["seconds"] >= 0).all()
+
+
+def test_callback_and_disabled_recording(test_file):
+    """Test passing records to a callback and not recording afterwards."""
+    records = []
+    with instrumentation.instrument(callback=records.append) as recorder:
+        collection = adnipy.read_csv(test_file)
+    collection.adni.rid()
+    assert records == recorder.records
+    assert len(records) == 1
+
+
+def test_recording_from_environment_variable():
+    """Test recording all calls with ADNIPY_INSTRUMENT."""
+    statement = (
+        "import pandas as pd; "
+        "from adnipy import instrumentation; "
+        "pd.DataFrame({'Subject ID': ['101_S_1001']}).adni.rid(); "
+        "assert len(instrumentation.global_recorder.records) == 1"
+    )
+    environment = dict(os.environ, ADNIPY_INSTRUMENT="1")
+    subprocess.run([sys.executable, "-c", statement], check=True, env=environment)
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for running per-subject work in parallel."""
+
+# pylint: disable=W0621
+
+# Standard library imports
+import contextlib
+import io
+import warnings
+
+# Third party imports
+import pandas as pd
+import pytest
+
+from adnipy import adnipy, parallel, synthetic
+
+
+@pytest.fixture
+def collection():
+    """Provide a standardized synthetic collection."""
+    collection = synthetic.make_collection(n_subjects=40, n_visits=4)
+    with contextlib.redirect_stdout(io.StringIO()):
+        collection = collection.adni.standard_column_names()
+    return collection.adni.standard_dates()
+
+
+@pytest.mark.parametrize("n_shards", [1, 3, 8, 100])
+def test_shards_do_not_split_subjects(collection, n_shards):
+    """Test each subject being in exactly one shard."""
+    shards = parallel.subject_shards(collection, n_shards)
+    assert len(shards) <= n_shards
+    assert sum(len(shard) for shard in shards) == len(collection)
+    subjects = [set(shard["Subject ID"]) for shard in shards]
+    assert sum(len(shard) for shard in subjects) == collection["Subject ID"].nunique()
+
+
+@pytest.mark.parametrize("backend", ["threads", "processes"])
+def test_matching_images_in_parallel(collection, backend):
+    """Test matching images in parallel giving the serial result."""
+    columns = ["Subject ID", "SCANDATE", "Image ID"]
+    pet = collection.loc[collection["Modality"] == "PET", columns]
+    mri = collection.loc[collection["Modality"] == "MRI", columns]
+    mri = mri[mri["Subject ID"] > "500"]
+    with warnings.catch_warnings(record=True) as serial:
+        warnings.simplefilter("always")
+        correct = adnipy.get_matching_images(pet, mri)
+    with warnings.catch_warnings(record=True) as parallel_warnings:
+        warnings.simplefilter("always")
+        matches = adnipy.get_matching_images(pet, mri, n_jobs=4, backend=backend)
+    pd.testing.assert_frame_equal(correct, matches)
+
+    assert len(serial) == len(parallel_warnings) == 1
+    assert parallel_warnings[0].category is serial[0].category
+    message = str(parallel_warnings[0].message)
+    assert message.startswith("Could not find matching images for:")
+    for subject in pet.loc[pet["Subject ID"] <= "500", "Subject ID"].unique():
+        assert subject in message
+
+
+def _warn_for_subjects(shard):
+    """Warn with the subjects of a shard."""
+    warnings.warn("subjects " + ", ".join(shard["Subject ID"].unique()), stacklevel=2)
+    warnings.warn("same for all shards", stacklevel=2)
+    return shard
+
+
+@pytest.mark.parametrize("backend", ["threads", "processes"])
+def test_warnings_of_shards(collection, backend):
+    """Test warnings of shards reaching the caller once."""
+    with warnings.catch_warnings(record=True) as recorded:
+        warnings.simplefilter("always")
+        parallel.map_subjects(
+            _warn_for_subjects, [collection], n_jobs=4, backend=backend
+        )
+    messages = [str(warning.message) for warning in recorded]
+    assert "same for all shards" in messages
+    subjects = [message for message in messages if message.startswith("subjects ")]
+    assert len(subjects) == 4
+    assert all(warning.category is UserWarning for warning in recorded)
+
+
+def test_timepoints_in_parallel(collection):
+    """Test extracting timepoints in parallel giving the serial result."""
+    collection = collection.drop(columns="Description")
+    correct = collection.copy().adni.timepoints()
+    timepoints = collection.adni.timepoints(n_jobs=3)
+    assert list(correct) == list(timepoints)
+    for timepoint, dataframe in correct.items():
+        pd.testing.assert_frame_equal(dataframe, timepoints[timepoint])
+
+
+def test_slopes_in_parallel():
+    """Test fitting slopes in parallel giving the serial result."""
+    adnimerge = synthetic.make_adnimerge(n_subjects=50, n_visits=5)
+    correct = adnimerge.adni.slopes(["MMSE", "ADAS13"])
+    slopes = adnimerge.adni.slopes(["MMSE", "ADAS13"], n_jobs=4)
+    pd.testing.assert_frame_equal(correct, slopes)
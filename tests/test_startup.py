@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+"""Startup time benchmarks for importing `adnipy`."""
+
+# Standard library imports
+import subprocess
+import sys
+
+# Third party imports
+import pytest
+
+# cumulative import time of adnipy in microseconds
+IMPORT_TIME_BUDGET = 50_000
+HEAVY_MODULES = ("pandas", "numpy", "matplotlib")
+
+
+def import_times(statement):
+    """Run a statement with -X importtime and get cumulative import times."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        times[module.strip()] = int(cumulative)
+
+    return times
+
+
+@pytest.mark.parametrize(
+    "statement",
+    ["import adnipy", "from adnipy.data import image_id_from_filename"],
+)
+def test_import_is_lightweight(statement):
+    """Test imports not loading heavy dependencies and staying fast."""
+    times = import_times(statement)
+    assert not set(HEAVY_MODULES) & set(times)
+    assert times["adnipy"] < IMPORT_TIME_BUDGET
+
+
+def test_attributes_are_imported_on_first_access():
+    """Test lazy attributes and the accessor being available after access."""
+    statement = (
+        "import sys, adnipy; "
+        "assert 'pandas' not in sys.modules; "
+        "import pandas as pd; "
+        "assert adnipy.read_csv.__module__ == 'adnipy.adnipy'; "
+        "assert hasattr(pd.DataFrame(), 'adni')"
+    )
+    subprocess.run([sys.executable, "-c", statement], check=True)
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import adnipy; import pandas as pd",
+        "from adnipy import synthetic; import pandas as pd",
+        "import adnipy.data; import pandas as pd",
+    ],
+)
+def test_accessor_is_registered_after_pandas(statement):
+    """Test the accessor not depending on the order of the imports."""
+    statement += "; assert hasattr(pd.DataFrame(), 'adni')"
+    subprocess.run([sys.executable, "-c", statement], check=True)
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the subject index."""
+
+# pylint: disable=W0621
+
+# Third party imports
+import numpy as np
+import pandas as pd
+import pytest
+
+from adnipy.subjects import SubjectIndex
+
+
+@pytest.fixture
+def test_tables():
+    """Provide a collection and ADNIMERGE-like table."""
+    collection = pd.DataFrame(
+        {
+            "Subject ID": ["102_S_1002", "101_S_1001", "102_S_1002", "104_S_1004"],
+            "Image ID": [200002, 100001, 100002, 100004],
+        }
+    )
+    adnimerge = pd.DataFrame(
+        {
+            "RID": [1004, 1001, 1001],
+            "VISCODE": ["bl", "m12", "bl"],
+            "MMSE": [28.0, 27.0, 29.0],
+        }
+    )
+    return {"collection": collection, "adnimerge": adnimerge}
+
+
+def test_subject_rows_are_sorted(test_tables):
+    """Test getting all rows of one subject from each table."""
+    index = SubjectIndex(test_tables)
+    rows = index.get(1002)
+    assert rows["collection"]["Image ID"].tolist() == [100002, 200002]
+    assert rows["adnimerge"].empty
+    assert index.get(1001, "adnimerge")["MMSE"].tolist() == [27.0, 29.0]
+
+
+def test_missing_subject(test_tables):
+    """Test looking up subjects outside of the indexed range."""
+    index = SubjectIndex(test_tables)
+    assert 1003 not in index
+    assert 9999 not in index
+    assert 1004 in index
+    assert index.get(9999, "collection").empty
+
+
+def test_save_and_load_memory_mapped(test_tables, tmp_path):
+    """Test the index being the same after saving and loading."""
+    pytest.importorskip("pyarrow")
+    index = SubjectIndex(test_tables)
+    index.save(tmp_path / "index")
+    loaded = SubjectIndex.load(tmp_path / "index")
+    assert isinstance(loaded.offsets["collection"], np.memmap)
+    for name, table in index.tables.items():
+        pd.testing.assert_frame_equal(table, loaded.tables[name])
+        np.testing.assert_array_equal(index.offsets[name], loaded.offsets[name])
+    pd.testing.assert_frame_equal(
+        index.get(1001, "collection"), loaded.get(1001, "collection")
+    )
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for generating synthetic ADNI data."""
+
+# Standard library imports
+import contextlib
+import io
+
+# Third party imports
+import pandas as pd
+
+from adnipy import synthetic
+
+
+def test_same_seed_gives_same_data():
+    """Test generating the same tables with the same seed."""
+    first = synthetic.make_collection(n_subjects=20, seed=1)
+    second = synthetic.make_collection(n_subjects=20, seed=1)
+    other = synthetic.make_collection(n_subjects=20, seed=2)
+    pd.testing.assert_frame_equal(first, second)
+    assert not first.equals(other)
+
+
+def test_tables_share_subjects():
+    """Test the subjects and visits being consistent across tables."""
+    collection = synthetic.make_collection(
+        n_subjects=30, n_visits=5, modalities=["MRI"]
+    )
+    adnimerge = synthetic.make_adnimerge(n_subjects=30, n_visits=5)
+    taumeta = synthetic.make_taumeta(n_subjects=30, n_visits=5)
+    assert len(collection) == len(adnimerge) == len(taumeta)
+    assert set(collection["Subject"]) == set(adnimerge["PTID"])
+    assert set(taumeta["RID"]) == set(adnimerge["RID"])
+    assert adnimerge.groupby("RID").size().max() <= 5
+
+
+def test_standardizing_synthetic_collection():
+    """Test the accessor methods working on a synthetic collection."""
+    collection = synthetic.make_collection(n_subjects=10)
+    with contextlib.redirect_stdout(io.StringIO()):
+        collection = collection.adni.standard_column_names()
+    collection = collection.adni.standard_dates()
+    assert pd.api.types.is_datetime64_any_dtype(collection["SCANDATE"])
+    assert (collection["Subject ID"].str[-4:].astype(int) == collection["RID"]).all()
+
+
+def test_roster_ids_are_unique():
+    """Test subjects having their own roster ID above 9999 subjects."""
+    adnimerge = synthetic.make_adnimerge(n_subjects=12000, n_visits=1)
+    assert adnimerge["RID"].nunique() == 12000
+    with contextlib.redirect_stdout(io.StringIO()):
+        adnimerge = adnimerge.drop(columns="RID").adni.standard_column_names()
+    assert adnimerge["RID"].nunique() == 12000